@@ -0,0 +1,186 @@
+import random
+import tempfile
+import time
+
+import numpy as np
+from pathlib import Path
+
+from main import (
+    Day1Accumulator,
+    load_columns,
+    part_1,
+    part_1_columnar,
+    part_2,
+    part_2_columnar,
+    read_input,
+    solve_external,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
+
+def timed(func, *args) -> tuple[int, float]:
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float]: The result of the function and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_columns(size: int, seed: int = 0) -> tuple[list[int], list[int]]:
+    """
+    Generates two random columns of 5-digit location IDs.
+
+    Args:
+        size (int): Number of pairs to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        tuple[list[int], list[int]]: The left and right columns.
+    """
+    rng = random.Random(seed)
+    col_1 = [rng.randint(10000, 99999) for _ in range(size)]
+    col_2 = [rng.randint(10000, 99999) for _ in range(size)]
+    return col_1, col_2
+
+
+def bench_columnar(size: int) -> None:
+    """
+    Compares the list-based and columnar versions of both parts on synthetic data.
+
+    Args:
+        size (int): Number of pairs to generate.
+    """
+    col_1, col_2 = synthetic_columns(size)
+    arr_1, arr_2 = np.array(col_1), np.array(col_2)
+
+    result_1, list_1 = timed(part_1, col_1, col_2)
+    columnar_1, array_1 = timed(part_1_columnar, arr_1, arr_2)
+    result_2, list_2 = timed(part_2, col_1, col_2)
+    columnar_2, array_2 = timed(part_2_columnar, arr_1, arr_2)
+    assert result_1 == columnar_1 and result_2 == columnar_2
+
+    print(
+        f"columnar n={size:>9}: "
+        f"part_1 {list_1:.3f}s -> {array_1:.3f}s, "
+        f"part_2 {list_2:.3f}s -> {array_2:.3f}s"
+    )
+
+
+def bench_parsing(size: int) -> None:
+    """
+    Compares parsing a synthetic file into lists with read_input, without its
+    cache, and into arrays with load_columns.
+
+    Args:
+        size (int): Number of pairs to generate.
+    """
+    col_1, col_2 = synthetic_columns(size)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.writelines(f"{a}   {b}\n" for a, b in zip(col_1, col_2))
+        file.flush()
+
+        lists, list_time = timed(read_input.__wrapped__, file.name)
+        (arr_1, arr_2), array_time = timed(load_columns, file.name)
+    assert lists == (col_1, col_2)
+    assert arr_1.tolist() == col_1 and arr_2.tolist() == col_2
+
+    print(f"parsing n={size:>9}: lists {list_time:.3f}s -> arrays {array_time:.3f}s")
+
+
+def bench_external(size: int, chunk_size: int) -> None:
+    """
+    Compares the in-memory parts with the external-sort mode on a synthetic file.
+
+    Args:
+        size (int): Number of pairs to generate.
+        chunk_size (int): Number of pairs sorted per run.
+    """
+    col_1, col_2 = synthetic_columns(size)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.writelines(f"{a}   {b}\n" for a, b in zip(col_1, col_2))
+        file.flush()
+
+        (result_1, result_2), external = timed(solve_external, file.name, chunk_size)
+
+    in_memory = time.perf_counter()
+    assert result_1 == part_1(col_1, col_2) and result_2 == part_2(col_1, col_2)
+    in_memory = time.perf_counter() - in_memory
+
+    print(
+        f"external n={size:>9} chunk={chunk_size:>7}: "
+        f"in-memory {in_memory:.3f}s, external {external:.3f}s"
+    )
+
+
+def bench_accumulator(size: int, batch_size: int) -> None:
+    """
+    Compares the incremental accumulator with recomputing both parts from scratch
+    after every batch.
+
+    Args:
+        size (int): Number of pairs to stream.
+        batch_size (int): Number of pairs added between two queries.
+    """
+    col_1, col_2 = synthetic_columns(size)
+
+    start = time.perf_counter()
+    for end in range(batch_size, size + 1, batch_size):
+        recomputed = (
+            part_1(col_1[:end], col_2[:end]),
+            part_2(col_1[:end], col_2[:end]),
+        )
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    accumulator = Day1Accumulator()
+    for end in range(batch_size, size + 1, batch_size):
+        accumulator.add_batch(
+            zip(col_1[end - batch_size : end], col_2[end - batch_size : end])
+        )
+        incremental = (accumulator.distance, accumulator.similarity)
+    incremental_time = time.perf_counter() - start
+    assert recomputed == incremental
+
+    print(
+        f"accumulator n={size:>9} batch={batch_size:>6}: "
+        f"recompute {full:.3f}s, incremental {incremental_time:.3f}s"
+    )
+
+
+def main():
+    col_1, col_2 = load_columns(INPUT_PATH)
+    assert part_1_columnar(col_1, col_2) == part_1(col_1.tolist(), col_2.tolist())
+    assert part_2_columnar(col_1, col_2) == part_2(col_1.tolist(), col_2.tolist())
+
+    for size in (10_000, 100_000, 1_000_000):
+        bench_parsing(size)
+        bench_columnar(size)
+
+    assert solve_external(INPUT_PATH, chunk_size=64) == (
+        part_1(col_1.tolist(), col_2.tolist()),
+        part_2(col_1.tolist(), col_2.tolist()),
+    )
+    for size in (100_000, 1_000_000):
+        bench_external(size, chunk_size=100_000)
+
+    accumulator = Day1Accumulator(bucket_size=8)
+    accumulator.add_batch(zip(col_1.tolist(), col_2.tolist()))
+    assert (accumulator.distance, accumulator.similarity) == (
+        part_1(col_1.tolist(), col_2.tolist()),
+        part_2(col_1.tolist(), col_2.tolist()),
+    )
+    for size, batch_size in ((100_000, 1_000), (200_000, 1_000)):
+        bench_accumulator(size, batch_size)
+
+
+if __name__ == "__main__":
+    main()
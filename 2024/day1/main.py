@@ -1,4 +1,24 @@
+import heapq
+import os
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, insort
 from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import chain, groupby, islice
+from operator import sub
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from aoc.cache import cached_parser  # noqa: E402
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+RUN_BLOCK_SIZE = 1 << 16
 
 
 def part_1(col_1: list[int], col_2: list[int]) -> int:
@@ -37,20 +57,334 @@ def part_2(col_1: list[int], col_2: list[int]) -> int:
     return sum(number * occurrences.get(number, 0) for number in col_1)
 
 
-def main():
+def load_columns(path: str) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Parses both columns of the input file in bulk into compact int64 arrays.
+
+    Args:
+        path (str): Path to the input file with one "a b" pair per line.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The left and right columns.
+    """
+    import numpy as np
+
+    # Text mode of fromfile converts every number in C, any whitespace separates them
+    pairs = np.fromfile(path, dtype=np.int64, sep=" ").reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def part_1_columnar(col_1: "np.ndarray", col_2: "np.ndarray") -> int:
+    """
+    Vectorized version of part_1: sorts both columns and sums the absolute
+    differences with array operations.
+
+    Args:
+        col_1 (np.ndarray): The first column of integers.
+        col_2 (np.ndarray): The second column of integers.
+
+    Returns:
+        int: The same result as part_1.
+    """
+    import numpy as np
+
+    return int(np.abs(np.sort(col_1) - np.sort(col_2)).sum())
+
+
+def part_2_columnar(col_1: "np.ndarray", col_2: "np.ndarray") -> int:
+    """
+    Vectorized version of part_2: joins the sorted columns, counting the
+    occurrences of every element of col_1 in col_2 with two binary searches
+    instead of one Counter lookup per element.
+
+    Args:
+        col_1 (np.ndarray): The first column of integers.
+        col_2 (np.ndarray): The second column of integers.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    import numpy as np
+
+    # Sorted queries keep the binary searches cache friendly
+    sorted_1 = np.sort(col_1)
+    sorted_2 = np.sort(col_2)
+    occurrences = np.searchsorted(sorted_2, sorted_1, side="right") - np.searchsorted(
+        sorted_2, sorted_1, side="left"
+    )
+    return int((sorted_1 * occurrences).sum())
+
+
+def write_sorted_runs(
+    path: str, chunk_size: int, tmp_dir: str
+) -> tuple[list[str], list[str]]:
+    """
+    Reads the input file in chunks of lines, sorts each chunk per column and writes
+    every sorted chunk as a binary run file.
+
+    Args:
+        path (str): Path to the input file with one "a b" pair per line.
+        chunk_size (int): Maximum number of pairs held in memory at once.
+        tmp_dir (str): Directory where the run files are written.
+
+    Returns:
+        tuple[list[str], list[str]]: The run files of the left and right columns.
+    """
+    runs_1, runs_2 = [], []
+    with open(path, "rb") as file:
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                break
+            values = array("q", map(int, b" ".join(lines).split()))
+            for column, runs in ((values[0::2], runs_1), (values[1::2], runs_2)):
+                run_path = os.path.join(tmp_dir, f"run_{len(runs_1) + len(runs_2)}")
+                with open(run_path, "wb") as run_file:
+                    array("q", sorted(column)).tofile(run_file)
+                runs.append(run_path)
+
+    return runs_1, runs_2
+
+
+def read_run(run_path: str) -> Iterator[int]:
+    """
+    Streams the values of a binary run file in fixed-size blocks.
+
+    Args:
+        run_path (str): Path to the run file.
+
+    Yields:
+        int: The values of the run, in order.
+    """
+    with open(run_path, "rb") as run_file:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(run_file, RUN_BLOCK_SIZE)
+            except EOFError:
+                yield from block
+                return
+            yield from block
+
+
+def merge_runs(runs: list[str]) -> Iterator[int]:
+    """
+    K-way merges sorted run files into a single sorted stream.
+
+    Args:
+        runs (list[str]): Paths to the sorted run files.
+
+    Returns:
+        Iterator[int]: The merged values in ascending order.
+    """
+    return heapq.merge(*(read_run(run_path) for run_path in runs))
+
+
+def merge_scores(sorted_1: Iterator[int], sorted_2: Iterator[int]) -> tuple[int, int]:
+    """
+    Computes both parts in a single merge of two sorted streams of equal length,
+    walking their distinct values in increasing order. Equal values on both sides
+    add to the similarity score as in a merge-join. The distance of sorted
+    columns is also the area between their counting functions: between two
+    consecutive values, it grows by their gap times the difference between the
+    number of values already seen on each side.
+
+    Args:
+        sorted_1 (Iterator[int]): The left column in ascending order.
+        sorted_2 (Iterator[int]): The right column in ascending order.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    groups_1 = ((key, sum(1 for _ in group)) for key, group in groupby(sorted_1))
+    groups_2 = ((key, sum(1 for _ in group)) for key, group in groupby(sorted_2))
+    key_1, count_1 = next(groups_1, (None, 0))
+    key_2, count_2 = next(groups_2, (None, 0))
+
+    distance = similarity = 0
+    # Values seen in the left column minus values seen in the right one
+    balance = 0
+    previous = None
+    while key_1 is not None or key_2 is not None:
+        if key_2 is None or (key_1 is not None and key_1 < key_2):
+            key = key_1
+        else:
+            key = key_2
+        if previous is not None:
+            distance += abs(balance) * (key - previous)
+        previous = key
+
+        if key_1 == key and key_2 == key:
+            similarity += key * count_1 * count_2
+        if key_1 == key:
+            balance += count_1
+            key_1, count_1 = next(groups_1, (None, 0))
+        if key_2 == key:
+            balance -= count_2
+            key_2, count_2 = next(groups_2, (None, 0))
+
+    return distance, similarity
+
+
+def solve_external(path: str, chunk_size: int = 1_000_000) -> tuple[int, int]:
+    """
+    Computes both parts in bounded memory with an external sort: the columns are
+    sorted in runs of chunk_size pairs on disk, and k-way merged back as streams
+    read once by merge_scores.
+
+    Args:
+        path (str): Path to the input file with one "a b" pair per line.
+        chunk_size (int): Maximum number of pairs held in memory at once.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        runs_1, runs_2 = write_sorted_runs(path, chunk_size, tmp_dir)
+        return merge_scores(merge_runs(runs_1), merge_runs(runs_2))
+
+
+class BucketedSortedList:
+    """
+    Sorted multiset of integers stored as a list of small sorted buckets, so an
+    insert is a binary search over the bucket maxima plus a bounded insert into a
+    single bucket instead of shifting the whole list.
+    """
+
+    __slots__ = ("bucket_size", "buckets", "maxes", "size")
+
+    def __init__(self, bucket_size: int = 1024):
+        self.bucket_size = bucket_size
+        self.buckets: list[list[int]] = []
+        self.maxes: list[int] = []
+        self.size = 0
+
+    def add(self, value: int) -> None:
+        """
+        Inserts a value keeping the global sorted order.
+
+        Args:
+            value (int): The value to insert.
+        """
+        self.size += 1
+        if not self.buckets:
+            self.buckets.append([value])
+            self.maxes.append(value)
+            return
+
+        i = bisect_left(self.maxes, value)
+        if i == len(self.buckets):
+            i -= 1
+            self.maxes[i] = value
+        bucket = self.buckets[i]
+        insort(bucket, value)
+
+        if len(bucket) > 2 * self.bucket_size:
+            # Split the bucket in half to keep inserts bounded
+            half = bucket[self.bucket_size :]
+            del bucket[self.bucket_size :]
+            self.buckets.insert(i + 1, half)
+            self.maxes.insert(i, bucket[-1])
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self.buckets)
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class Day1Accumulator:
+    """
+    Incremental scorer for streams of location pairs. Both columns are kept in
+    sorted order and counted as pairs arrive, so the similarity score is updated
+    in O(1) per pair and the distance sum is a linear walk of the sorted columns,
+    only done on request, instead of a full re-sort after every batch.
+    """
+
+    def __init__(self, bucket_size: int = 1024):
+        self.sorted_1 = BucketedSortedList(bucket_size)
+        self.sorted_2 = BucketedSortedList(bucket_size)
+        self.occurrences_1: Counter[int] = Counter()
+        self.occurrences_2: Counter[int] = Counter()
+        self._similarity = 0
+        self._distance: int | None = 0
+
+    def add(self, a: int, b: int) -> None:
+        """
+        Adds one location pair.
+
+        Args:
+            a (int): The value of the left column.
+            b (int): The value of the right column.
+        """
+        self.sorted_1.add(a)
+        self.sorted_2.add(b)
+
+        # Every new value pairs with all the existing equal values of the other column
+        self._similarity += a * self.occurrences_2[a]
+        self.occurrences_1[a] += 1
+        self.occurrences_2[b] += 1
+        self._similarity += b * self.occurrences_1[b]
+
+        self._distance = None
+
+    def add_batch(self, pairs: Iterable[tuple[int, int]]) -> None:
+        """
+        Adds several location pairs.
+
+        Args:
+            pairs (Iterable[tuple[int, int]]): The (left, right) pairs to add.
+        """
+        for a, b in pairs:
+            self.add(a, b)
+
+    @property
+    def distance(self) -> int:
+        """
+        The part_1 result for all the pairs added so far.
+        """
+        if self._distance is None:
+            self._distance = sum(map(abs, map(sub, self.sorted_1, self.sorted_2)))
+        return self._distance
+
+    @property
+    def similarity(self) -> int:
+        """
+        The part_2 result for all the pairs added so far.
+        """
+        return self._similarity
+
+
+@cached_parser("2024-day1")
+def read_input(path: str) -> tuple[list[int], list[int]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[int], list[int]]: The left and right columns of location IDs.
+    """
     col_1 = []
     col_2 = []
-    with open("input.txt", "r") as file:
+    with open(path, "r") as file:
         for line in file:
             a, b = map(int, line.split())
             col_1.append(a)
             col_2.append(b)
 
+    return col_1, col_2
+
+
+def main():
+    col_1, col_2 = read_input(INPUT_PATH)
+
     result_1 = part_1(col_1, col_2)
     result_2 = part_2(col_1, col_2)
 
     print(f"Result 1: {result_1}")
-    print(f"Result 1: {result_2}")
+    print(f"Result 2: {result_2}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+import random
+import time
+from pathlib import Path
+
+from main import (
+    count_safe_batched,
+    is_safe,
+    is_safe_dampened,
+    is_safe_with_one_removal,
+    part_1,
+    part_2,
+    part_2_dampened,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
+
+def timed(func, *args) -> tuple[int, float]:
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float]: The result of the function and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_reports(count: int, length: int, seed: int = 0) -> list[list[int]]:
+    """
+    Generates mostly monotonic random reports with a few bad levels, so that
+    safe, dampened-safe and unsafe reports are all represented.
+
+    Args:
+        count (int): Number of reports to generate.
+        length (int): Number of levels per report.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list[list[int]]: The generated reports.
+    """
+    rng = random.Random(seed)
+    reports = []
+    for _ in range(count):
+        sign = rng.choice((1, -1))
+        level = rng.randint(1, 99)
+        report = []
+        for _ in range(length):
+            level += sign * rng.randint(1, 3)
+            report.append(level)
+        for _ in range(rng.choice((0, 0, 1, 1, 2))):
+            report[rng.randrange(length)] += rng.randint(-4, 4)
+        reports.append(report)
+    return reports
+
+
+def validate_dampened(count: int, seed: int = 0) -> None:
+    """
+    Checks the linear dampened check and the batched engine against the original
+    functions on small random reports of arbitrary levels.
+
+    Args:
+        count (int): Number of reports to check.
+        seed (int): Seed for the random generator.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        report = [rng.randint(0, 9) for _ in range(rng.randint(0, 8))]
+        expected = is_safe(report) or is_safe_with_one_removal(report)
+        assert is_safe_dampened(report) == expected, report
+
+    for report in synthetic_reports(count, 12, seed):
+        expected = is_safe(report) or is_safe_with_one_removal(report)
+        assert is_safe_dampened(report) == expected, report
+
+    reports = [
+        [rng.randint(0, 9) for _ in range(rng.randint(0, 8))] for _ in range(count)
+    ]
+    assert count_safe_batched(reports) == (part_1(reports), part_2(reports))
+
+
+def bench_dampened(count: int, length: int) -> None:
+    """
+    Compares the original and the linear dampened checks on synthetic reports.
+
+    Args:
+        count (int): Number of reports to generate.
+        length (int): Number of levels per report.
+    """
+    reports = synthetic_reports(count, length)
+    original, original_time = timed(part_2, reports)
+    dampened, dampened_time = timed(part_2_dampened, reports)
+    assert original == dampened
+
+    print(
+        f"dampened count={count:>7} length={length:>5}: "
+        f"original {original_time:.3f}s, linear {dampened_time:.3f}s"
+    )
+
+
+def bench_batched(count: int, length: int) -> None:
+    """
+    Compares the per-report parts with the batched NumPy engine on synthetic
+    reports of mixed lengths around the given one.
+
+    Args:
+        count (int): Number of reports to generate.
+        length (int): Typical number of levels per report.
+    """
+    reports = []
+    for offset in range(-2, 3):
+        reports.extend(synthetic_reports(count // 5, length + offset, seed=offset))
+
+    start = time.perf_counter()
+    expected = (part_1(reports), part_2_dampened(reports))
+    per_report = time.perf_counter() - start
+    batched, batched_time = timed(count_safe_batched, reports)
+    assert expected == batched
+
+    print(
+        f"batched count={count:>8} length~{length:>3}: "
+        f"per report {per_report:.3f}s, batched {batched_time:.3f}s"
+    )
+
+
+def main():
+    with open(INPUT_PATH, "r") as file:
+        reports = [list(map(int, line.split())) for line in file]
+    assert part_2_dampened(reports) == part_2(reports)
+    assert count_safe_batched(reports) == (part_1(reports), part_2(reports))
+
+    validate_dampened(100_000)
+    for count, length in ((100_000, 8), (1_000, 1_000), (100, 2_000)):
+        bench_dampened(count, length)
+    for count, length in ((100_000, 6), (1_000_000, 8)):
+        bench_batched(count, length)
+
+
+if __name__ == "__main__":
+    main()
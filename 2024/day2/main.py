@@ -1,3 +1,17 @@
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from aoc.cache import cached_parser  # noqa: E402
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+
+
 def is_safe(report: list[int]) -> bool:
     """
     Checks if a report is safe. The report is safe if:
@@ -42,6 +56,67 @@ def is_safe_with_one_removal(report: list[int]) -> bool:
     return False
 
 
+def _is_monotonic_from(report: list[int], sign: int, start: int, skip: int) -> bool:
+    """
+    Checks that the levels from start onwards, ignoring the level at skip, move in
+    the direction given by sign with steps of at least 1 and at most 3.
+
+    Args:
+        report (list[int]): List of report levels.
+        sign (int): 1 for increasing levels, -1 for decreasing levels.
+        start (int): Index of the first level to check.
+        skip (int): Index of the level to ignore.
+
+    Returns:
+        bool: True if the remaining levels are safe in that direction.
+    """
+    prev = report[start]
+    for i in range(start + 1, len(report)):
+        if i == skip:
+            continue
+        step = sign * (report[i] - prev)
+        if step < 1 or step > 3:
+            return False
+        prev = report[i]
+    return True
+
+
+def is_safe_dampened(report: list[int]) -> bool:
+    """
+    Checks if a report is safe with at most one level removed, in linear time and
+    without copying the report. For each direction only the two levels around the
+    first bad step can fix it, so only those removals are tried, and only from
+    the first bad step onwards since every previous step is already valid.
+
+    Args:
+        report (list[int]): List of report levels.
+
+    Returns:
+        bool: True if the report is safe with at most one removal, False otherwise.
+    """
+    for sign in (1, -1):
+        first_bad = None
+        for i in range(len(report) - 1):
+            step = sign * (report[i + 1] - report[i])
+            if step < 1 or step > 3:
+                first_bad = i
+                break
+
+        if first_bad is None:
+            return True
+
+        # Remove the level before the bad step, resuming from its predecessor
+        start = first_bad - 1 if first_bad > 0 else 1
+        if _is_monotonic_from(report, sign, start, first_bad):
+            return True
+
+        # Remove the level after the bad step
+        if _is_monotonic_from(report, sign, first_bad, first_bad + 1):
+            return True
+
+    return False
+
+
 def part_1(reports: list[list[int]]) -> int:
     """
     Count how many reports are safe without any removal.
@@ -70,11 +145,113 @@ def part_2(reports: list[list[int]]) -> int:
     )
 
 
-def main():
-    reports = []
-    with open("input.txt", "r") as file:
+def part_2_dampened(reports: list[list[int]]) -> int:
+    """
+    Count how many reports are safe with one level removal, using the linear
+    dampened check.
+
+    Args:
+        reports (list[list[int]]): List of reports.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    return sum(1 for report in reports if is_safe_dampened(report))
+
+
+def group_reports_by_length(reports: list[list[int]]) -> dict[int, "np.ndarray"]:
+    """
+    Groups the reports by number of levels into 2D integer matrices.
+
+    Args:
+        reports (list[list[int]]): List of reports.
+
+    Returns:
+        dict[int, np.ndarray]: For each report length, a matrix with one report per row.
+    """
+    import numpy as np
+
+    groups: dict[int, list[list[int]]] = {}
+    for report in reports:
+        groups.setdefault(len(report), []).append(report)
+
+    return {
+        length: np.array(group, dtype=np.int64).reshape(len(group), length)
+        for length, group in groups.items()
+    }
+
+
+def safe_mask(levels: "np.ndarray") -> "np.ndarray":
+    """
+    Checks the safety of many reports at once along the last axis.
+
+    Args:
+        levels (np.ndarray): Array of reports, with the levels on the last axis.
+
+    Returns:
+        np.ndarray: Boolean array, True where the report is safe.
+    """
+    import numpy as np
+
+    diffs = np.diff(levels, axis=-1)
+    is_increasing = ((diffs >= 1) & (diffs <= 3)).all(axis=-1)
+    is_decreasing = ((diffs <= -1) & (diffs >= -3)).all(axis=-1)
+    return is_increasing | is_decreasing
+
+
+def count_safe_batched(reports: list[list[int]]) -> tuple[int, int]:
+    """
+    Counts the safe reports without and with one level removal using vectorized
+    masks over groups of reports with the same length. The removal variants of a
+    group are gathered into a single (reports, removed level, levels) array.
+
+    Args:
+        reports (list[list[int]]): List of reports.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    import numpy as np
+
+    safe_count = 0
+    dampened_count = 0
+    for length, matrix in group_reports_by_length(reports).items():
+        is_safe_now = safe_mask(matrix)
+        safe_count += int(is_safe_now.sum())
+
+        if length <= 2:
+            # Removing one level always leaves a safe report
+            dampened_count += len(matrix)
+            continue
+
+        # Row k of kept holds the indices of the levels left after removing level k
+        kept = np.array([[j for j in range(length) if j != k] for k in range(length)])
+        is_safe_removed = safe_mask(matrix[:, kept]).any(axis=1)
+        dampened_count += int((is_safe_now | is_safe_removed).sum())
+
+    return safe_count, dampened_count
+
+
+@cached_parser("2024-day2")
+def read_input(path: str) -> tuple[list[list[int]]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[list[int]]]: The list of reports.
+    """
+    with open(path, "r") as file:
         reports = [list(map(int, line.split())) for line in file]
 
+    return (reports,)
+
+
+def main():
+    (reports,) = read_input(INPUT_PATH)
+
     result_1 = part_1(reports)
     result_2 = part_2(reports)
 
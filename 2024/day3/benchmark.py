@@ -0,0 +1,159 @@
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from functools import reduce
+
+from main import (
+    ChunkSummary,
+    part_1,
+    part_2,
+    scan_file,
+    scan_file_parallel,
+    summarize_range,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+NOISE = "mul(don't()do()[]{}<>,;:!?%#@^&*-+'select()where()from()who() \n0123456789"
+
+
+def synthetic_memory(size: int, seed: int = 0) -> str:
+    """
+    Generates corrupted memory mixing random noise, valid and broken instructions.
+
+    Args:
+        size (int): Approximate number of characters to generate.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        str: The generated memory.
+    """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        choice = rng.random()
+        if choice < 0.3:
+            part = f"mul({rng.randint(0, 999)},{rng.randint(0, 999)})"
+        elif choice < 0.35:
+            part = rng.choice(("do()", "don't()", "mul(1,2", "mul(1234,5)"))
+        else:
+            part = "".join(rng.choices(NOISE, k=rng.randint(1, 8)))
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+
+def validate_scan(path: str) -> None:
+    """
+    Checks the streaming scanner against part_1 and part_2 for several window
+    sizes, including windows barely larger than one instruction.
+
+    Args:
+        path (str): Path to the input file.
+    """
+    with open(path, "r") as file:
+        lines = file.readlines()
+    expected = (part_1(lines), part_2(lines))
+    for window_size in (13, 17, 64, 4096, 1 << 20):
+        assert scan_file(path, window_size) == expected, window_size
+
+
+def validate_summaries(path: str, seed: int = 0) -> None:
+    """
+    Checks the chunk summaries against part_1 and part_2 for random splits of the
+    file, including ranges smaller than one instruction, and the process pool
+    for several worker counts.
+
+    Args:
+        path (str): Path to the input file.
+        seed (int): Seed for the random generator.
+    """
+    with open(path, "r") as file:
+        lines = file.readlines()
+    expected = (part_1(lines), part_2(lines))
+
+    rng = random.Random(seed)
+    size = os.path.getsize(path)
+    for chunk_count in (1, 2, 7, 100, 1000):
+        bounds = sorted({0, size, *(rng.randrange(size) for _ in range(chunk_count))})
+        summary = reduce(
+            ChunkSummary.combine,
+            (summarize_range(path, *bound) for bound in zip(bounds, bounds[1:])),
+        )
+        assert (summary.total_sum, summary.enabled_sum(True)) == expected
+
+    for workers in (1, 2, 3):
+        assert scan_file_parallel(path, workers) == expected
+
+
+def bench_scan(size: int) -> None:
+    """
+    Compares readlines plus part_1 and part_2 with the single-pass mmap scanner
+    on a synthetic file.
+
+    Args:
+        size (int): Approximate size of the generated file in bytes.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(synthetic_memory(size))
+        file.flush()
+
+        start = time.perf_counter()
+        with open(file.name, "r") as memory:
+            lines = memory.readlines()
+        expected = (part_1(lines), part_2(lines))
+        lines_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        streamed = scan_file(file.name)
+        scan_time = time.perf_counter() - start
+        assert streamed == expected
+
+    print(f"scan size={size:>10}: lines {lines_time:.3f}s, mmap {scan_time:.3f}s")
+
+
+def bench_parallel(size: int, max_workers: int) -> None:
+    """
+    Measures the scaling of the process pool from 1 to max_workers workers.
+
+    Args:
+        size (int): Approximate size of the generated file in bytes.
+        max_workers (int): Largest number of workers to measure.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(synthetic_memory(size))
+        file.flush()
+
+        expected, serial = None, None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            result = scan_file_parallel(file.name, workers)
+            elapsed = time.perf_counter() - start
+            expected = expected or result
+            serial = serial or elapsed
+            assert result == expected
+
+            print(
+                f"parallel size={size:>10} workers={workers:>2}: "
+                f"{elapsed:.3f}s (x{serial / elapsed:.2f})"
+            )
+
+
+def main():
+    validate_scan(INPUT_PATH)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.write(synthetic_memory(100_000, seed=1))
+        file.flush()
+        validate_scan(file.name)
+        validate_summaries(file.name)
+
+    for size in (1_000_000, 10_000_000):
+        bench_scan(size)
+    bench_parallel(10_000_000, max(os.cpu_count() or 1, 2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,14 @@
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import NamedTuple
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+INSTRUCTION_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
+# Longest instruction, "mul(123,456)", bounds the overlap between windows
+MAX_INSTRUCTION_LENGTH = 12
 
 
 def part_1(lines: list[str]) -> int:
@@ -54,10 +64,230 @@ def part_2(lines: list[str]) -> int:
     return total_sum
 
 
-def main():
-    with open("input.txt", "r") as file:
+class StreamingScanner:
+    """
+    Scans corrupted memory window by window, keeping the do()/don't() state and
+    both running sums between windows so the input never has to be in memory.
+    """
+
+    def __init__(self):
+        self.mul_enabled = True
+        self.total_sum = 0
+        self.enabled_sum = 0
+
+    def scan(self, buffer, pos: int, endpos: int, final: bool) -> int:
+        """
+        Processes the instructions starting in buffer[pos:endpos]. Unless this is
+        the final window, instructions starting in the last bytes of the window
+        could be cut by it, so they are left for the next window.
+
+        Args:
+            buffer: A bytes-like object (bytes, mmap, ...) with the memory.
+            pos (int): Start of the window.
+            endpos (int): End of the window.
+            final (bool): Whether the window reaches the end of the memory.
+
+        Returns:
+            int: The position where the next window must start.
+        """
+        cut = endpos if final else max(pos, endpos - MAX_INSTRUCTION_LENGTH + 1)
+        next_pos = cut
+
+        for match in INSTRUCTION_PATTERN.finditer(buffer, pos, endpos):
+            if match.start() >= cut:
+                break
+
+            instruction = match.group(0)
+            if instruction == b"do()":
+                self.mul_enabled = True
+            elif instruction == b"don't()":
+                self.mul_enabled = False
+            else:
+                product = int(match.group(1)) * int(match.group(2))
+                self.total_sum += product
+                if self.mul_enabled:
+                    self.enabled_sum += product
+            next_pos = max(cut, match.end())
+
+        return next_pos
+
+
+def scan_file(path: str, window_size: int = 1 << 20) -> tuple[int, int]:
+    """
+    Computes both parts in a single pass over a memory-mapped file, running the
+    precompiled regex over fixed-size windows with constant memory.
+
+    Args:
+        path (str): Path to the input file.
+        window_size (int): Number of bytes scanned per window.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    if window_size <= MAX_INSTRUCTION_LENGTH:
+        raise ValueError(
+            f"window_size must be larger than {MAX_INSTRUCTION_LENGTH} bytes"
+        )
+
+    scanner = StreamingScanner()
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return 0, 0
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            pos = 0
+            while pos < size:
+                endpos = min(pos + window_size, size)
+                pos = scanner.scan(memory, pos, endpos, final=endpos == size)
+
+    return scanner.total_sum, scanner.enabled_sum
+
+
+class ChunkSummary(NamedTuple):
+    """
+    Composable summary of a byte range of the memory. The products before the
+    first do()/don't() depend on the state the range starts in, every product
+    after it does not.
+    """
+
+    total_sum: int
+    prefix_sum: int
+    known_sum: int
+    last_toggle: bool | None
+
+    def enabled_sum(self, mul_enabled: bool) -> int:
+        """
+        Returns the sum of the enabled products of the range.
+
+        Args:
+            mul_enabled (bool): Whether mul is enabled at the start of the range.
+
+        Returns:
+            int: The sum of the enabled mul(x, y) operations of the range.
+        """
+        return self.known_sum + (self.prefix_sum if mul_enabled else 0)
+
+    def combine(self, other: "ChunkSummary") -> "ChunkSummary":
+        """
+        Summarizes this range followed by the next one. The operation is
+        associative, so summaries can be reduced in any grouping.
+
+        Args:
+            other (ChunkSummary): The summary of the range that follows.
+
+        Returns:
+            ChunkSummary: The summary of both ranges.
+        """
+        if self.last_toggle is None:
+            return ChunkSummary(
+                self.total_sum + other.total_sum,
+                self.prefix_sum + other.prefix_sum,
+                other.known_sum,
+                other.last_toggle,
+            )
+
+        return ChunkSummary(
+            self.total_sum + other.total_sum,
+            self.prefix_sum,
+            self.known_sum + other.enabled_sum(self.last_toggle),
+            self.last_toggle if other.last_toggle is None else other.last_toggle,
+        )
+
+
+def summarize_range(path: str, start: int, end: int) -> ChunkSummary:
+    """
+    Summarizes the instructions starting in the byte range [start, end) of a file.
+    An instruction starting in the range may end after it, so the scan reads up
+    to MAX_INSTRUCTION_LENGTH - 1 bytes past the end. Instructions cannot overlap
+    each other, so starting the scan in the middle of the previous range's last
+    instruction cannot produce a false match.
+
+    Args:
+        path (str): Path to the input file.
+        start (int): First byte of the range.
+        end (int): End of the range.
+
+    Returns:
+        ChunkSummary: The summary of the range.
+    """
+    total_sum = prefix_sum = known_sum = 0
+    last_toggle = None
+
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            endpos = min(end + MAX_INSTRUCTION_LENGTH - 1, len(memory))
+            for match in INSTRUCTION_PATTERN.finditer(memory, start, endpos):
+                if match.start() >= end:
+                    break
+
+                instruction = match.group(0)
+                if instruction == b"do()":
+                    last_toggle = True
+                elif instruction == b"don't()":
+                    last_toggle = False
+                else:
+                    product = int(match.group(1)) * int(match.group(2))
+                    total_sum += product
+                    if last_toggle is None:
+                        prefix_sum += product
+                    elif last_toggle:
+                        known_sum += product
+
+    return ChunkSummary(total_sum, prefix_sum, known_sum, last_toggle)
+
+
+def scan_file_parallel(
+    path: str, workers: int | None = None, chunks_per_worker: int = 4
+) -> tuple[int, int]:
+    """
+    Computes both parts by splitting the file into byte ranges summarized by a
+    process pool and reducing the summaries in order.
+
+    Args:
+        path (str): Path to the input file.
+        workers (int | None): Number of worker processes, all the CPUs by default.
+        chunks_per_worker (int): Number of byte ranges per worker, to balance load.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, 0
+
+    workers = workers or os.cpu_count() or 1
+    chunk_count = min(workers * chunks_per_worker, size)
+    bounds = [size * i // chunk_count for i in range(chunk_count + 1)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(
+            summarize_range, [path] * chunk_count, bounds[:-1], bounds[1:]
+        )
+        summary = reduce(ChunkSummary.combine, summaries)
+
+    return summary.total_sum, summary.enabled_sum(True)
+
+
+def read_input(path: str) -> tuple[list[str]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[str]]: The lines of the corrupted memory.
+    """
+    with open(path, "r") as file:
         lines = file.readlines()
 
+    return (lines,)
+
+
+def main():
+    (lines,) = read_input(INPUT_PATH)
+
     result_1 = part_1(lines)
     result_2 = part_2(lines)
 
@@ -0,0 +1,290 @@
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from main import (
+    X_MAS_TEMPLATE,
+    count_pattern,
+    count_pattern_banded,
+    count_words,
+    count_words_banded,
+    part_1,
+    part_2,
+    part_2_stencil,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
+
+def synthetic_grid(size: int, letters: str = "XMAS", seed: int = 0) -> list[str]:
+    """
+    Generates a square grid of random letters.
+
+    Args:
+        size (int): Number of rows and columns.
+        letters (str): The letters to draw from.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list[str]: The rows of the grid, each ending with a newline.
+    """
+    rng = random.Random(seed)
+    return ["".join(rng.choices(letters, k=size)) + "\n" for _ in range(size)]
+
+
+def count_word_naive(lines: list[str], word: str) -> int:
+    """
+    Counts a word in every direction by checking every cell, as part_1 does for
+    XMAS, to validate the search engine on other words.
+
+    Args:
+        lines (list[str]): A list of string lines
+        word (str): The word to count.
+
+    Returns:
+        int: Total count of the word found in the grid.
+    """
+    grid = [line.rstrip("\n") for line in lines]
+    rows, cols = len(grid), len(grid[0])
+    count = 0
+    for x in range(rows):
+        for y in range(cols):
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if (dx or dy) and all(
+                        0 <= x + i * dx < rows
+                        and 0 <= y + i * dy < cols
+                        and grid[x + i * dx][y + i * dy] == char
+                        for i, char in enumerate(word)
+                    ):
+                        count += 1
+    return count
+
+
+def validate_count_words(seed: int = 0) -> None:
+    """
+    Checks the search engine against the naive count on small random grids,
+    including overlapping, palindromic and single-letter words.
+
+    Args:
+        seed (int): Seed for the random generator.
+    """
+    words = ["XMAS", "MAS", "SAM", "AXA", "X", "XMASAMX", "MM"]
+    rng = random.Random(seed)
+    for _ in range(20):
+        lines = synthetic_grid(rng.randint(1, 12), "XMAS", rng.randrange(1 << 30))
+        counts = count_words(lines, words)
+        for word in words:
+            assert counts[word] == count_word_naive(lines, word), word
+
+
+def bench_count_words(size: int, words: list[str]) -> None:
+    """
+    Compares part_1, which only counts XMAS, with the search engine counting
+    several words at once on a synthetic grid.
+
+    Args:
+        size (int): Number of rows and columns of the grid.
+        words (list[str]): The words to count, starting with XMAS.
+    """
+    lines = synthetic_grid(size)
+
+    start = time.perf_counter()
+    expected = part_1(lines)
+    part_1_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = count_words(lines, words)
+    engine_time = time.perf_counter() - start
+    assert counts["XMAS"] == expected
+
+    print(
+        f"words size={size:>5}: part_1 (XMAS) {part_1_time:.3f}s, "
+        f"engine ({len(words)} words) {engine_time:.3f}s"
+    )
+
+
+def count_pattern_naive(lines: list[str], pattern: list[str]) -> int:
+    """
+    Counts the placements of a single masked pattern by checking every cell.
+
+    Args:
+        lines (list[str]): A list of string lines
+        pattern (list[str]): The rows of the pattern, with "." for any letter.
+
+    Returns:
+        int: Number of positions where the pattern matches.
+    """
+    grid = [line.rstrip("\n") for line in lines]
+    height, width = len(pattern), len(pattern[0])
+    return sum(
+        all(
+            char == "." or grid[x + i][y + j] == char
+            for i, row in enumerate(pattern)
+            for j, char in enumerate(row)
+        )
+        for x in range(len(grid) - height + 1)
+        for y in range(len(grid[0]) - width + 1)
+    )
+
+
+def validate_stencil(seed: int = 0) -> None:
+    """
+    Checks the stencil matcher against part_2 and against the naive count of
+    every variant of an asymmetric pattern on small random grids.
+
+    Args:
+        seed (int): Seed for the random generator.
+    """
+    variants = [["XM", ".A"], ["MX", "A."], [".A", "XM"], ["A.", "MX"]]
+    variants += [["X.", "MA"], [".X", "AM"], ["MA", "X."], ["AM", ".X"]]
+    rng = random.Random(seed)
+    for _ in range(20):
+        lines = synthetic_grid(rng.randint(1, 12), "XMAS", rng.randrange(1 << 30))
+        assert part_2_stencil(lines) == part_2(lines)
+        expected = sum(count_pattern_naive(lines, variant) for variant in variants)
+        assert count_pattern(lines, ["XM", ".A"]) == expected
+
+
+def bench_stencil(size: int) -> None:
+    """
+    Compares part_2 with the stencil matcher on a synthetic grid.
+
+    Args:
+        size (int): Number of rows and columns of the grid.
+    """
+    lines = synthetic_grid(size)
+
+    start = time.perf_counter()
+    expected = part_2(lines)
+    part_2_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stencil = part_2_stencil(lines)
+    stencil_time = time.perf_counter() - start
+    assert stencil == expected
+
+    print(
+        f"x-mas size={size:>5}: part_2 {part_2_time:.3f}s, stencil {stencil_time:.3f}s"
+    )
+
+
+def measured(func, *args) -> tuple[int, float, int]:
+    """
+    Runs a function once and measures its wall-clock time and peak memory. The
+    time includes the tracemalloc overhead, so compare it only between runs of
+    this function.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float, int]: The result, the elapsed seconds and the peak
+                                traced memory in bytes.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def load_and_count_words(path: str, words: list[str]) -> dict[str, int]:
+    """
+    Loads the whole grid file and counts the words, as main does.
+    """
+    with open(path, "r") as file:
+        return count_words(file.readlines(), words)
+
+
+def load_and_count_pattern(path: str, template: list[str]) -> int:
+    """
+    Loads the whole grid file and counts the pattern, as main does.
+    """
+    with open(path, "r") as file:
+        return count_pattern(file.readlines(), template)
+
+
+def validate_banded(seed: int = 0) -> None:
+    """
+    Checks the banded mode against the whole-grid counts on random grids for band
+    sizes from the minimum up to larger than the grid.
+
+    Args:
+        seed (int): Seed for the random generator.
+    """
+    words = ["XMAS", "MAS", "X", "SAMXMAS"]
+    rng = random.Random(seed)
+    for _ in range(10):
+        lines = synthetic_grid(rng.randint(1, 20), "XMAS", rng.randrange(1 << 30))
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+            file.writelines(lines)
+            file.flush()
+            for band_size in (6, 7, 10, 25):
+                assert count_words_banded(file.name, words, band_size) == count_words(
+                    lines, words
+                )
+            for band_size in (2, 3, 25):
+                assert count_pattern_banded(
+                    file.name, X_MAS_TEMPLATE, band_size
+                ) == part_2(lines)
+
+
+def bench_banded(size: int, band_size: int) -> None:
+    """
+    Compares time and peak memory of the whole-grid and banded modes on a
+    synthetic grid file.
+
+    Args:
+        size (int): Number of rows and columns of the grid.
+        band_size (int): Number of new rows per band.
+    """
+    words = ["XMAS"]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.writelines(synthetic_grid(size))
+        file.flush()
+
+        runs = (
+            ("words", load_and_count_words, count_words_banded, words),
+            ("x-mas", load_and_count_pattern, count_pattern_banded, X_MAS_TEMPLATE),
+        )
+        for name, whole, banded, arg in runs:
+            expected, whole_time, whole_peak = measured(whole, file.name, arg)
+            result, banded_time, banded_peak = measured(
+                banded, file.name, arg, band_size
+            )
+            assert result == expected
+
+            print(
+                f"banded {name} size={size:>5} band={band_size:>4}: "
+                f"whole {whole_time:.3f}s {whole_peak / 2**20:.1f}MiB, "
+                f"banded {banded_time:.3f}s {banded_peak / 2**20:.1f}MiB"
+            )
+
+
+def main():
+    with open(INPUT_PATH, "r") as file:
+        lines = file.readlines()
+    assert count_words(lines, ["XMAS"])["XMAS"] == part_1(lines)
+    assert part_2_stencil(lines) == part_2(lines)
+
+    validate_count_words()
+    for size in (140, 500, 1000):
+        bench_count_words(size, ["XMAS", "SAMX", "MAS", "AXA", "MSAMS"])
+
+    validate_stencil()
+    for size in (140, 1000, 3000):
+        bench_stencil(size)
+
+    validate_banded()
+    for band_size in (64, 256):
+        bench_banded(1000, band_size)
+
+
+if __name__ == "__main__":
+    main()
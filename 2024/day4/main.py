@@ -1,3 +1,22 @@
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from aoc.grid import ALL_DIRECTIONS, SENTINEL, Grid  # noqa: E402
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+X_MAS_TEMPLATE = ["M.S", ".A.", "M.S"]
+WILDCARD = "."
+
+
 def part_1(lines: list[str]) -> int:
     """
     Count all occurrences of the word XMAS in the grid, considering all directions.
@@ -9,36 +28,22 @@ def part_1(lines: list[str]) -> int:
         int: Total count of the word found in the grid.
     """
     word = "XMAS"
-    grid = [list(line) for line in lines]
-    rows, cols = len(grid), len(grid[0])
-    word_len = len(word)
-    directions = [
-        (0, 1),  # Horizontal right
-        (1, 0),  # Vertical down
-        (1, 1),  # Diagonal down-right
-        (1, -1),  # Diagonal down-left
-        (0, -1),  # Horizontal left
-        (-1, 0),  # Vertical up
-        (-1, -1),  # Diagonal up-left
-        (-1, 1),  # Diagonal up-right
-    ]
+    # The border is as wide as the word, so no walk needs a bounds check
+    grid = Grid(lines, border=SENTINEL, padding=len(word) - 1)
+    cells = grid.cells
+    offsets = grid.offsets(ALL_DIRECTIONS)
+    rest = word[1:].encode()
     count = 0
 
-    def is_valid(x, y):
-        return 0 <= x < rows and 0 <= y < cols
-
-    def check_word(x, y, dx, dy):
-        for i in range(word_len):
-            nx, ny = x + i * dx, y + i * dy
-            if not is_valid(nx, ny) or grid[nx][ny] != word[i]:
-                return False
-        return True
-
-    for x in range(rows):
-        for y in range(cols):
-            for dx, dy in directions:
-                if check_word(x, y, dx, dy):
-                    count += 1
+    for start in grid.find_all(word[0]):
+        for offset in offsets:
+            index = start
+            for code in rest:
+                index += offset
+                if cells[index] != code:
+                    break
+            else:
+                count += 1
 
     return count
 
@@ -53,60 +58,327 @@ def part_2(lines: list[str]) -> int:
     Returns:
         int: Total count of "X-MAS" patterns found in the grid.
     """
-    grid = [list(line) for line in lines]
-    rows, cols = len(grid), len(grid[0])
+    grid = Grid(lines, border=SENTINEL)
+    cells = grid.cells
+    m, s = ord("M"), ord("S")
+    up_left, up_right = grid.offsets([(-1, -1), (-1, 1)])
     count = 0
 
-    def is_x_mas(x, y):
+    def is_mas(center, offset):
         """
-        Check if there is an X-MAS pattern centered at grid[x][y].
+        Check if the diagonal through center reads MAS in either direction.
         """
-        # Validate indices for diagonals
-        if x - 1 >= 0 and x + 1 < rows and y - 1 >= 0 and y + 1 < cols:
-            # Check diagonals for standard orientation
-            standard_forward = (
-                grid[x - 1][y - 1] == "M"
-                and grid[x][y] == "A"
-                and grid[x + 1][y + 1] == "S"
-            )
-
-            standard_backward = (
-                grid[x - 1][y + 1] == "M"
-                and grid[x][y] == "A"
-                and grid[x + 1][y - 1] == "S"
-            )
-            # Check diagonals for inverted orientation
-            inverted_forward = (
-                grid[x + 1][y - 1] == "M"
-                and grid[x][y] == "A"
-                and grid[x - 1][y + 1] == "S"
-            )
-
-            inverted_backward = (
-                grid[x + 1][y + 1] == "M"
-                and grid[x][y] == "A"
-                and grid[x - 1][y - 1] == "S"
-            )
-
-        if (standard_forward or inverted_backward) and (
-            standard_backward or inverted_forward
-        ):
-            return True
-        return False
-
-    # Iterate over the grid to find X-MAS patterns
-    for x in range(1, rows - 1):
-        for y in range(1, cols - 1):
-            if is_x_mas(x, y):
-                count += 1
+        before, after = cells[center - offset], cells[center + offset]
+        return (before == m and after == s) or (before == s and after == m)
+
+    # Every X-MAS pattern is centered on an A
+    for center in grid.find_all("A"):
+        if is_mas(center, up_left) and is_mas(center, up_right):
+            count += 1
 
     return count
 
 
-def main():
-    with open("input.txt", "r") as file:
+class AhoCorasick:
+    """
+    Aho-Corasick automaton to count the occurrences of several words at once in a
+    single left-to-right pass over a text.
+    """
+
+    def __init__(self, words: list[str]):
+        self.words = words
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[list[int]] = [[]]
+
+        for index, word in enumerate(words):
+            state = 0
+            for char in word:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append(index)
+
+        # Breadth-first so the failure state of every parent is already known
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] += self.output[self.fail[child]]
+
+    def count(self, text: str, counts: list[int]) -> None:
+        """
+        Adds the occurrences of every word in the text to counts.
+
+        Args:
+            text (str): The text to search.
+            counts (list[int]): Occurrences per word, in the order of self.words.
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                counts[index] += 1
+
+
+def grid_lines(grid: list[str]) -> Iterator[str]:
+    """
+    Extracts every line of the grid once per axis: rows, columns, diagonals and
+    anti-diagonals. Reading them in reverse covers the other four directions.
+
+    Args:
+        grid (list[str]): The rows of the grid, all with the same length.
+
+    Yields:
+        str: The lines of the grid.
+    """
+    rows, cols = len(grid), len(grid[0])
+    yield from grid
+    yield from ("".join(column) for column in zip(*grid))
+    for d in range(-(rows - 1), cols):
+        yield "".join(grid[x][x + d] for x in range(max(0, -d), min(rows, cols - d)))
+    for d in range(rows + cols - 1):
+        yield "".join(
+            grid[x][d - x] for x in range(max(0, d - cols + 1), min(rows, d + 1))
+        )
+
+
+def count_words(lines: list[str], words: list[str]) -> dict[str, int]:
+    """
+    Counts the occurrences of several words in the grid, considering all
+    directions, with a single Aho-Corasick pass over every line of the grid and
+    its reverse.
+
+    Args:
+        lines (list[str]): A list of string lines
+        words (list[str]): The words to count.
+
+    Returns:
+        dict[str, int]: Total count of each word found in the grid.
+    """
+    words = list(dict.fromkeys(words))
+    grid = [line.rstrip("\n") for line in lines]
+    automaton = AhoCorasick(words)
+    counts = [0] * len(words)
+    for line in grid_lines(grid):
+        automaton.count(line, counts)
+        automaton.count(line[::-1], counts)
+
+    return dict(zip(words, counts))
+
+
+def pattern_variants(template: list[str]) -> list[list[str]]:
+    """
+    Generates the distinct rotations and reflections of a pattern.
+
+    Args:
+        template (list[str]): The rows of the pattern.
+
+    Returns:
+        list[list[str]]: The distinct variants of the pattern, template included.
+    """
+    variants = []
+    pattern = template
+    for _ in range(4):
+        pattern = ["".join(row) for row in zip(*pattern[::-1])]  # Rotate right
+        for variant in (pattern, [row[::-1] for row in pattern]):
+            if variant not in variants:
+                variants.append(variant)
+    return variants
+
+
+def load_grid_array(lines: list[str]) -> "np.ndarray":
+    """
+    Loads the grid as a 2D uint8 array of character codes.
+
+    Args:
+        lines (list[str]): A list of string lines
+
+    Returns:
+        np.ndarray: The grid, one byte per cell.
+    """
+    import numpy as np
+
+    grid = Grid(lines)
+    return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.rows, grid.cols)
+
+
+def count_stencil(grid: "np.ndarray", pattern: list[str]) -> int:
+    """
+    Counts the placements of a masked pattern in the grid. Every non-wildcard cell
+    of the pattern compares one shifted slice of the grid, and the comparisons
+    are combined with a logical AND.
+
+    Args:
+        grid (np.ndarray): The grid as returned by load_grid_array.
+        pattern (list[str]): The rows of the pattern, with WILDCARD for any letter.
+
+    Returns:
+        int: Number of positions where the pattern matches.
+    """
+    import numpy as np
+
+    height, width = len(pattern), len(pattern[0])
+    rows, cols = grid.shape[0] - height + 1, grid.shape[1] - width + 1
+    if rows <= 0 or cols <= 0:
+        return 0
+
+    mask = np.ones((rows, cols), dtype=bool)
+    for i, row in enumerate(pattern):
+        for j, char in enumerate(row):
+            if char != WILDCARD:
+                mask &= grid[i : i + rows, j : j + cols] == ord(char)
+
+    return int(mask.sum())
+
+
+def count_pattern(lines: list[str], template: list[str]) -> int:
+    """
+    Counts the occurrences of a masked pattern in any rotation or reflection.
+
+    Args:
+        lines (list[str]): A list of string lines
+        template (list[str]): The rows of the pattern, with WILDCARD for any letter.
+
+    Returns:
+        int: Total count of the pattern found in the grid.
+    """
+    grid = load_grid_array(lines)
+    return sum(count_stencil(grid, variant) for variant in pattern_variants(template))
+
+
+def part_2_stencil(lines: list[str]) -> int:
+    """
+    Count all occurrences of "X-MAS" patterns in the grid with the vectorized
+    stencil matcher.
+
+    Args:
+        lines (list[str]): A list of string lines
+
+    Returns:
+        int: The same result as part_2.
+    """
+    return count_pattern(lines, X_MAS_TEMPLATE)
+
+
+def iter_bands(
+    path: str, band_size: int, overlap: int
+) -> Iterator[tuple[list[str], int]]:
+    """
+    Streams the grid in horizontal bands of band_size new rows, each one preceded
+    by the last overlap rows of the previous band.
+
+    Args:
+        path (str): Path to the grid file.
+        band_size (int): Number of new rows per band.
+        overlap (int): Number of rows carried over from the previous band.
+
+    Yields:
+        tuple[list[str], int]: The rows of the band and how many of them were
+                               carried over from the previous band.
+    """
+    carried: list[str] = []
+    with open(path, "r") as file:
+        while True:
+            rows = [line.rstrip("\n") for line in islice(file, band_size)]
+            rows = [row for row in rows if row]
+            if not rows:
+                return
+            band = carried + rows
+            yield band, len(carried)
+            carried = band[len(band) - overlap :] if overlap else []
+
+
+def count_words_banded(
+    path: str, words: list[str], band_size: int = 1024
+) -> dict[str, int]:
+    """
+    Counts the occurrences of several words in a grid file too large to load,
+    streaming it in bands that overlap by the length of the longest word minus
+    one. Consecutive bands share those rows, so the matches inside them are
+    counted twice and subtracted once; band_size must be at least the overlap so
+    that no row belongs to three bands.
+
+    Args:
+        path (str): Path to the grid file.
+        words (list[str]): The words to count.
+        band_size (int): Number of new rows per band.
+
+    Returns:
+        dict[str, int]: Total count of each word found in the grid.
+    """
+    words = list(dict.fromkeys(words))
+    overlap = max(map(len, words)) - 1
+    if band_size < max(overlap, 1):
+        raise ValueError(f"band_size must be at least {max(overlap, 1)} rows")
+
+    totals = dict.fromkeys(words, 0)
+    for band, carried in iter_bands(path, band_size, overlap):
+        for word, count in count_words(band, words).items():
+            totals[word] += count
+        if carried:
+            for word, count in count_words(band[:carried], words).items():
+                totals[word] -= count
+    return totals
+
+
+def count_pattern_banded(path: str, template: list[str], band_size: int = 1024) -> int:
+    """
+    Counts the occurrences of a masked pattern in any rotation or reflection in a
+    grid file too large to load, streaming it in bands that overlap by the size
+    of the pattern minus one, with the same double counting correction as
+    count_words_banded.
+
+    Args:
+        path (str): Path to the grid file.
+        template (list[str]): The rows of the pattern, with WILDCARD for any letter.
+        band_size (int): Number of new rows per band.
+
+    Returns:
+        int: Total count of the pattern found in the grid.
+    """
+    overlap = max(len(template), len(template[0])) - 1
+    if band_size < max(overlap, 1):
+        raise ValueError(f"band_size must be at least {max(overlap, 1)} rows")
+
+    total = 0
+    for band, carried in iter_bands(path, band_size, overlap):
+        total += count_pattern(band, template)
+        if carried:
+            total -= count_pattern(band[:carried], template)
+    return total
+
+
+def read_input(path: str) -> tuple[list[str]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[str]]: The lines of the grid.
+    """
+    with open(path, "r") as file:
         lines = file.readlines()
 
+    return (lines,)
+
+
+def main():
+    (lines,) = read_input(INPUT_PATH)
+
     result_1 = part_1(lines)
     result_2 = part_2(lines)
 
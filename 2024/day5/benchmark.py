@@ -0,0 +1,247 @@
+import math
+import random
+import time
+from pathlib import Path
+
+from main import (
+    OrderingIndex,
+    PrecedenceEngine,
+    classify_updates,
+    load_engine,
+    part_1,
+    part_1_engine,
+    part_2,
+    part_2_engine,
+    part_2_select,
+    read_input,
+)
+
+# Importable once main has put the repository root on the path
+from aoc.cache import bypass  # noqa: E402
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
+
+def timed(func, *args) -> tuple[int, float]:
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float]: The result of the function and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_input(
+    page_count: int, update_count: int, update_size: int, seed: int = 0
+) -> tuple[list[str], list[str]]:
+    """
+    Generates rules for every pair of pages of a random total order, and updates
+    of distinct pages, half of them already in order.
+
+    Args:
+        page_count (int): Number of distinct pages.
+        update_count (int): Number of updates.
+        update_size (int): Number of pages per update, odd so it has a middle page.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        tuple[list[str], list[str]]: The rules and the updates.
+    """
+    rng = random.Random(seed)
+    order = rng.sample(range(10, 10 + page_count), page_count)
+    rank = {page: i for i, page in enumerate(order)}
+    rules = [f"{a}|{b}" for i, a in enumerate(order) for b in order[i + 1 :]]
+    rng.shuffle(rules)
+
+    # The last page has no outgoing rule, which part_1 and part_2 do not support
+    updates = []
+    for i in range(update_count):
+        pages = rng.sample(order[:-1], update_size)
+        if i % 2:
+            pages.sort(key=rank.__getitem__)
+        updates.append(",".join(map(str, pages)))
+    return rules, updates
+
+
+def bench_engine(page_count: int, update_count: int, update_size: int) -> None:
+    """
+    Compares part_1 and part_2 with the precedence engine on synthetic input.
+
+    Args:
+        page_count (int): Number of distinct pages.
+        update_count (int): Number of updates.
+        update_size (int): Number of pages per update.
+    """
+    rules, updates = synthetic_input(page_count, update_count, update_size)
+
+    start = time.perf_counter()
+    expected = (part_1(rules, updates), part_2(rules, updates))
+    original = time.perf_counter() - start
+
+    load_engine.cache_clear()
+    start = time.perf_counter()
+    result = (part_1_engine(rules, updates), part_2_engine(rules, updates))
+    engine = time.perf_counter() - start
+    assert result == expected
+
+    load_engine.cache_clear()
+    start = time.perf_counter()
+    classification = classify_updates(rules, updates)
+    single_pass = time.perf_counter() - start
+    assert classification[:2] == expected
+
+    print(
+        f"engine rules={len(rules):>7} updates={update_count:>5}x{update_size:<4}: "
+        f"original {original:.3f}s, engine {engine:.3f}s, "
+        f"single pass {single_pass:.3f}s"
+    )
+
+
+def total_order_engine(page_count: int) -> PrecedenceEngine:
+    """
+    Builds the engine of a total order of pages 0..page_count-1 directly from its
+    bitmatrix, since the equivalent rules text would have page_count**2 / 2 rules.
+
+    Args:
+        page_count (int): Number of pages.
+
+    Returns:
+        PrecedenceEngine: Engine where page i must come before every page j > i.
+    """
+    engine = PrecedenceEngine([])
+    engine.index = {page: page for page in range(page_count)}
+    full = (1 << page_count) - 1
+    engine.after_masks = [full ^ ((2 << page) - 1) for page in range(page_count)]
+    engine.before_masks = [(1 << page) - 1 for page in range(page_count)]
+    return engine
+
+
+def bench_middle_page(
+    update_size: int,
+    update_count: int = 5,
+    previous: tuple[int, float] | None = None,
+) -> tuple[int, float]:
+    """
+    Compares reordering invalid updates with selecting their middle page. Given
+    the measurement of a smaller size, also shows the exponent k such that the
+    selection time grows like update_size**k, which should stay close to 1.
+
+    Args:
+        update_size (int): Number of pages per update.
+        update_count (int): Number of updates.
+        previous (tuple[int, float] | None): Update size and selection time of
+                                             an earlier call.
+
+    Returns:
+        tuple[int, float]: The update size and the selection time.
+    """
+    engine = total_order_engine(update_size)
+    rng = random.Random(update_size)
+    updates = [rng.sample(range(update_size), update_size) for _ in range(update_count)]
+
+    start = time.perf_counter()
+    expected = [engine.reorder(values)[len(values) // 2] for values in updates]
+    reorder = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = [engine.middle_page(values) for values in updates]
+    select = time.perf_counter() - start
+    assert result == expected
+
+    growth = ""
+    if previous is not None:
+        previous_size, previous_select = previous
+        exponent = math.log(select / previous_select) / math.log(
+            update_size / previous_size
+        )
+        growth = f", growth {exponent:.2f}"
+    print(
+        f"middle page size={update_size:>6}: "
+        f"reorder {reorder:.3f}s, select {select:.3f}s{growth}"
+    )
+    return update_size, select
+
+
+def bench_rule_changes(
+    page_count: int, update_count: int, update_size: int, changes: int
+) -> None:
+    """
+    Compares applying rule changes to the ordering index with classifying every
+    update again after each change, checking both give the same results.
+
+    Args:
+        page_count (int): Number of distinct pages.
+        update_count (int): Number of updates.
+        update_size (int): Number of pages per update.
+        changes (int): Number of rules removed and added back.
+    """
+    rules, updates = synthetic_input(page_count, update_count, update_size)
+    rng = random.Random(changes)
+    changed = [tuple(map(int, rule.split("|"))) for rule in rng.sample(rules, changes)]
+
+    index = OrderingIndex(rules, updates)
+    current = set(rules)
+    incremental = recompute = 0.0
+    for step, (page_1, page_2) in enumerate(changed + changed):
+        rule = f"{page_1}|{page_2}"
+        start = time.perf_counter()
+        if step < changes:
+            index.remove_rule(page_1, page_2)
+            current.discard(rule)
+        else:
+            index.add_rule(page_1, page_2)
+            current.add(rule)
+        incremental += time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = classify_updates(sorted(current), updates)
+        recompute += time.perf_counter() - start
+        assert (index.result_1, index.result_2) == expected[:2]
+        assert index.is_valid == expected.is_valid
+
+    print(
+        f"rule changes={2 * changes:>4} updates={update_count:>6}: "
+        f"recompute {recompute:.3f}s, incremental {incremental:.3f}s"
+    )
+
+
+def main():
+    # Time building the engines, not loading them from the parsed-input cache
+    with bypass():
+        run_benchmarks()
+
+
+def run_benchmarks():
+    rules, updates = read_input(INPUT_PATH)
+    assert part_1_engine(rules, updates) == part_1(rules, updates)
+    assert part_2_engine(rules, updates) == part_2(rules, updates)
+    classification = classify_updates(rules, updates)
+    assert classification[:2] == (part_1(rules, updates), part_2(rules, updates))
+    assert part_2_select(rules, updates) == part_2(rules, updates)
+
+    for page_count, update_count, update_size in (
+        (100, 1_000, 23),
+        (700, 200, 101),
+        (700, 20, 501),
+    ):
+        bench_engine(page_count, update_count, update_size)
+
+    rules, updates = synthetic_input(1_002, 5, 1_001)
+    assert part_2_select(rules, updates) == part_2(rules, updates)
+    previous = None
+    for update_size in (1_001, 10_001, 30_001):
+        previous = bench_middle_page(update_size, previous=previous)
+
+    bench_rule_changes(100, 2_000, 23, 10)
+    bench_rule_changes(100, 10_000, 23, 10)
+
+
+if __name__ == "__main__":
+    main()
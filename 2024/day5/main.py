@@ -1,3 +1,17 @@
+import os
+import random
+import sys
+from collections import Counter, deque
+from functools import cmp_to_key, lru_cache
+from typing import NamedTuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from aoc.cache import load_or_compute  # noqa: E402
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+
+
 def parse_rules(rules: list[str]) -> dict[int, set[int]]:
     """Parse the list of rules of type XX|XX
 
@@ -20,6 +34,448 @@ def parse_rules(rules: list[str]) -> dict[int, set[int]]:
     return parsed_rules
 
 
+def load_rules(rules: list[str]) -> dict[int, set[int]]:
+    """
+    Parses the rules with parse_rules, through the parsed-input cache.
+
+    Args:
+        rules (list[str]): The list of lines from the input.
+
+    Returns:
+        dict[int, set[int]]: The result of parse_rules, a fresh copy per call.
+    """
+    return load_or_compute(
+        "2024-day5-rules", 1, "\n".join(rules).encode(), lambda: parse_rules(rules)
+    )
+
+
+def parse_update(update: str) -> list[int]:
+    """Parse an update of comma-separated page numbers
+
+    Args:
+        update (str): The update line from the input.
+
+    Returns:
+        list[int]: The page numbers of the update.
+    """
+    return list(map(int, update.split(",")))
+
+
+def mask_bytes(mask: int) -> bytes:
+    """
+    Converts a bitmask to little-endian bytes, bit j being bit j % 8 of byte j // 8.
+
+    Args:
+        mask (int): The bitmask.
+
+    Returns:
+        bytes: The bytes of the mask, without trailing zero bytes.
+    """
+    return mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+
+
+def has_bit(row: bytes, j: int) -> bool:
+    """
+    Reads one bit of a mask converted by mask_bytes, in constant time.
+
+    Args:
+        row (bytes): The bytes of the mask.
+        j (int): The index of the bit.
+
+    Returns:
+        bool: True if the bit is set.
+    """
+    return j >> 3 < len(row) and bool(row[j >> 3] >> (j & 7) & 1)
+
+
+class PrecedenceEngine:
+    """
+    Page ordering rules indexed for fast update validation and reordering. Page IDs
+    are mapped to dense indices and every page keeps a bitmask of the pages that
+    must come after it, forming a dense precedence bitmatrix, and of the pages
+    that must come before it, its transpose.
+
+    Testing one bit of a Python int shifts the whole int, which costs as much as
+    the number of pages. Single rule lookups therefore read the bit from a bytes
+    copy of the page's mask, made once and dropped when the rules of the page
+    change.
+    """
+
+    def __init__(self, rules: list[str]):
+        self.successors = parse_rules(rules)
+
+        pages = set(self.successors)
+        for after in self.successors.values():
+            pages |= after
+        self.index = {page: i for i, page in enumerate(sorted(pages))}
+
+        self.after_masks = [0] * len(self.index)
+        self.before_masks = [0] * len(self.index)
+        for page, after in self.successors.items():
+            i = self.index[page]
+            mask = 0
+            for other in after:
+                j = self.index[other]
+                mask |= 1 << j
+                self.before_masks[j] |= 1 << i
+            self.after_masks[i] = mask
+        self.rows: dict[int, bytes] = {}
+
+    def state(self) -> tuple:
+        """
+        Exports the engine as marshallable builtins, see from_state.
+
+        Returns:
+            tuple: The rules, page indices and both bitmatrices.
+        """
+        return self.successors, self.index, self.after_masks, self.before_masks
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "PrecedenceEngine":
+        """
+        Rebuilds an engine exported by state without parsing the rules again.
+
+        Args:
+            state (tuple): The result of state.
+
+        Returns:
+            PrecedenceEngine: The engine.
+        """
+        engine = cls.__new__(cls)
+        engine.successors, engine.index, engine.after_masks, engine.before_masks = state
+        engine.rows = {}
+        return engine
+
+    def add_rule(self, page_1: int, page_2: int) -> None:
+        """
+        Adds the rule page_1|page_2.
+
+        Args:
+            page_1 (int): The page that must come first.
+            page_2 (int): The page that must come after.
+        """
+        for page in (page_1, page_2):
+            if page not in self.index:
+                self.index[page] = len(self.after_masks)
+                self.after_masks.append(0)
+                self.before_masks.append(0)
+
+        i, j = self.index[page_1], self.index[page_2]
+        self.successors.setdefault(page_1, set()).add(page_2)
+        self.after_masks[i] |= 1 << j
+        self.before_masks[j] |= 1 << i
+        self.rows.pop(i, None)
+
+    def remove_rule(self, page_1: int, page_2: int) -> None:
+        """
+        Removes the rule page_1|page_2, if present.
+
+        Args:
+            page_1 (int): The page that must come first.
+            page_2 (int): The page that must come after.
+        """
+        if page_2 not in self.successors.get(page_1, ()):
+            return
+
+        i, j = self.index[page_1], self.index[page_2]
+        self.successors[page_1].discard(page_2)
+        self.after_masks[i] &= ~(1 << j)
+        self.before_masks[j] &= ~(1 << i)
+        self.rows.pop(i, None)
+
+    def row(self, i: int) -> bytes:
+        """
+        Returns the mask of the pages that must come after a page as bytes, so any
+        of its bits can be read in constant time.
+
+        Args:
+            i (int): The dense index of the page.
+
+        Returns:
+            bytes: The mask, see mask_bytes.
+        """
+        row = self.rows.get(i)
+        if row is None:
+            row = self.rows[i] = mask_bytes(self.after_masks[i])
+        return row
+
+    def precedes(self, i: int, j: int) -> bool:
+        """
+        Checks the bitmatrix for a rule between two pages, in constant time.
+
+        Args:
+            i (int): The dense index of the first page.
+            j (int): The dense index of the second page.
+
+        Returns:
+            bool: True if the first page must come before the second.
+        """
+        return has_bit(self.row(i), j)
+
+    def must_precede(self, page_1: int, page_2: int) -> bool:
+        """
+        Checks if a rule requires page_1 to come before page_2.
+
+        Args:
+            page_1 (int): The first page.
+            page_2 (int): The second page.
+
+        Returns:
+            bool: True if there is a rule page_1|page_2.
+        """
+        if page_1 not in self.index or page_2 not in self.index:
+            return False
+        return self.precedes(self.index[page_1], self.index[page_2])
+
+    def is_valid(self, values: list[int]) -> bool:
+        """
+        Checks if an update follows the rules in a single pass: no page may be
+        preceded by a page that the rules require after it. Repeated pages are
+        checked at every occurrence. Each page costs one AND of full-width masks,
+        done a machine word at a time; that stays cheaper than testing the pairs
+        of pages of the update one by one even for updates far smaller than the
+        set of pages.
+
+        Args:
+            values (list[int]): The page numbers of the update.
+
+        Returns:
+            bool: True if the update follows the rules, False otherwise.
+        """
+        index, after_masks = self.index, self.after_masks
+        seen = 0
+        for page in values:
+            i = index.get(page)
+            if i is None:
+                continue
+            if after_masks[i] & seen:
+                return False
+            seen |= 1 << i
+        return True
+
+    def compare(self, page_1: int, page_2: int) -> int:
+        """
+        Comparator following the rules, for sorting the pages of an update.
+
+        Args:
+            page_1 (int): The first page.
+            page_2 (int): The second page.
+
+        Returns:
+            int: -1 if page_1 must come first, 1 if page_2 must come first, else 0.
+        """
+        if self.must_precede(page_1, page_2):
+            return -1
+        if self.must_precede(page_2, page_1):
+            return 1
+        return 0
+
+    def reorder(self, values: list[int]) -> list[int]:
+        """
+        Orders the pages of an update following the rules. When the rules totally
+        order the pages of the update, a comparator sort on the bitmatrix is
+        enough; otherwise the pages are topologically sorted.
+
+        Args:
+            values (list[int]): The page numbers of the update.
+
+        Returns:
+            list[int]: The pages of the update in an order that follows the rules.
+
+        Raises:
+            ValueError: If the rules between the pages of the update are cyclic.
+        """
+        ordered = sorted(values, key=cmp_to_key(self.compare))
+        if self.is_valid(ordered):
+            return ordered
+        return self.topological_order(values)
+
+    def middle_page(self, values: list[int]) -> int:
+        """
+        Selects the middle page that the update would have once reordered,
+        without reordering it: a quickselect partitions the pages around a random
+        pivot and only keeps the side holding the middle, for an expected linear
+        number of comparisons. Each comparison is a constant-time lookup in the
+        two masks of the pivot, so the other pages' masks are never read. If a page is not ordered with
+        the pivot by any rule, its rank depends on the order reorder picks, so
+        the update is reordered instead.
+
+        Args:
+            values (list[int]): The page numbers of the update.
+
+        Returns:
+            int: The middle page of the reordered update.
+        """
+        index = self.index
+        pages = values
+        k = len(values) // 2
+        while True:
+            pivot = random.choice(pages)
+            i = index.get(pivot)
+            if i is None:
+                return self.reorder(values)[len(values) // 2]
+            pivot_after = self.row(i)
+            pivot_before = mask_bytes(self.before_masks[i])
+
+            before, after = [], []
+            same = 0
+            for page in pages:
+                j = index.get(page)
+                if j == i:
+                    same += 1
+                elif j is not None and has_bit(pivot_after, j):
+                    after.append(page)
+                elif j is not None and has_bit(pivot_before, j):
+                    before.append(page)
+                else:
+                    return self.reorder(values)[len(values) // 2]
+
+            if k < len(before):
+                pages = before
+            elif k < len(before) + same:
+                return pivot
+            else:
+                k -= len(before) + same
+                pages = after
+
+    def topological_order(self, values: list[int]) -> list[int]:
+        """
+        Orders the pages of an update with a topological sort of the rules that
+        involve two of its pages. Repeated pages are kept together.
+
+        Args:
+            values (list[int]): The page numbers of the update.
+
+        Returns:
+            list[int]: The pages of the update in an order that follows the rules.
+
+        Raises:
+            ValueError: If the rules between the pages of the update are cyclic.
+        """
+        occurrences = Counter(values)
+        in_update = {
+            page: self.successors.get(page, set()) & occurrences.keys()
+            for page in occurrences
+        }
+        predecessors = Counter(page for after in in_update.values() for page in after)
+
+        ready = deque(page for page in occurrences if not predecessors[page])
+        ordered = []
+        while ready:
+            page = ready.popleft()
+            ordered.extend([page] * occurrences[page])
+            for other in in_update[page]:
+                predecessors[other] -= 1
+                if not predecessors[other]:
+                    ready.append(other)
+
+        if len(ordered) != len(values):
+            raise ValueError(f"Cyclic rules between the pages of {values}")
+        return ordered
+
+
+@lru_cache(maxsize=8)
+def load_engine(rules_text: str) -> PrecedenceEngine:
+    """
+    Builds the precedence engine of a set of rules once per rules text. The
+    engine is also cached on disk, since loading its bitmatrices is about ten
+    times faster than parsing the rules and building them again.
+
+    Args:
+        rules_text (str): The rules, one 'X|Y' rule per line.
+
+    Returns:
+        PrecedenceEngine: The engine for those rules, shared between calls.
+    """
+    state = load_or_compute(
+        "2024-day5-engine",
+        1,
+        rules_text.encode(),
+        lambda: PrecedenceEngine(rules_text.splitlines()).state(),
+    )
+    return PrecedenceEngine.from_state(state)
+
+
+class UpdateClassification(NamedTuple):
+    """
+    Results of classifying every update against the rules in a single pass.
+    """
+
+    result_1: int
+    result_2: int
+    is_valid: list[bool]
+
+
+def classify_updates(rules: list[str], updates: list[str]) -> UpdateClassification:
+    """
+    Parses the rules once and classifies every update as valid or invalid in a
+    single pass, summing the middle page of the valid updates and of the
+    reordered invalid updates together.
+
+    Args:
+        rules (list[str]): A list of page ordering rules in the format 'X|Y'.
+        updates (list[str]): A list of comma-separated page number sequences.
+
+    Returns:
+        UpdateClassification: The results of part_1 and part_2, and whether each
+                              update is valid.
+    """
+    engine = load_engine("\n".join(rules))
+    result_1 = result_2 = 0
+    is_valid = []
+    for update in updates:
+        values = parse_update(update)
+        valid = engine.is_valid(values)
+        if valid:
+            result_1 += values[len(values) // 2]
+        else:
+            result_2 += engine.reorder(values)[len(values) // 2]
+        is_valid.append(valid)
+
+    return UpdateClassification(result_1, result_2, is_valid)
+
+
+def part_1_engine(rules: list[str], updates: list[str]) -> int:
+    """
+    Sums the middle page number of every valid update using the precedence engine.
+
+    Args:
+        rules (list[str]): A list of page ordering rules in the format 'X|Y'.
+        updates (list[str]): A list of comma-separated page number sequences.
+
+    Returns:
+        int: The same result as part_1.
+    """
+    engine = load_engine("\n".join(rules))
+    result = 0
+    for update in updates:
+        values = parse_update(update)
+        if engine.is_valid(values):
+            result += values[len(values) // 2]
+    return result
+
+
+def part_2_engine(rules: list[str], updates: list[str]) -> int:
+    """
+    Sums the middle page number of every invalid update after reordering it,
+    using the precedence engine.
+
+    Args:
+        rules (list[str]): A list of page ordering rules in the format 'X|Y'.
+        updates (list[str]): A list of comma-separated page number sequences.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    engine = load_engine("\n".join(rules))
+    result = 0
+    for update in updates:
+        values = parse_update(update)
+        if not engine.is_valid(values):
+            result += engine.reorder(values)[len(values) // 2]
+    return result
+
+
 def part_1(rules: list[str], updates: list[str]) -> int:
     """
     Processes the list of page update sequences to determine if each update
@@ -39,7 +495,7 @@ def part_1(rules: list[str], updates: list[str]) -> int:
              update is considered valid if it follows the page ordering rules.
 
     """
-    parsed_rules = parse_rules(rules)
+    parsed_rules = load_rules(rules)
 
     result = 0
     for update in updates:
@@ -77,7 +533,7 @@ def part_2(rules: list[str], updates: list[str]) -> int:
              before determining the middle page number.
     """
 
-    parsed_rules = parse_rules(rules)
+    parsed_rules = load_rules(rules)
 
     incorrect_updates = []
     for update in updates:
@@ -109,8 +565,180 @@ def part_2(rules: list[str], updates: list[str]) -> int:
     return result
 
 
-def main():
-    with open("input.txt", "r") as file:
+def part_2_select(rules: list[str], updates: list[str]) -> int:
+    """
+    Sums the middle page number of every invalid update, selecting it without
+    reordering the update.
+
+    Args:
+        rules (list[str]): A list of page ordering rules in the format 'X|Y'.
+        updates (list[str]): A list of comma-separated page number sequences.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    engine = load_engine("\n".join(rules))
+    result = 0
+    for update in updates:
+        values = parse_update(update)
+        if not engine.is_valid(values):
+            result += engine.middle_page(values)
+    return result
+
+
+class OrderingIndex:
+    """
+    Keeps both results up to date while the rules change. An inverted index from
+    every page to the updates containing it gives the updates holding both pages
+    of a rule, which are the only ones a change of that rule can affect.
+    """
+
+    def __init__(self, rules: list[str], updates: list[str]):
+        self.engine = PrecedenceEngine(rules)
+        self.updates = [parse_update(update) for update in updates]
+
+        self.page_updates: dict[int, set[int]] = {}
+        for update_id, values in enumerate(self.updates):
+            for page in values:
+                self.page_updates.setdefault(page, set()).add(update_id)
+
+        self.is_valid = [False] * len(self.updates)
+        self.middle_pages = [0] * len(self.updates)
+        self.result_1 = 0
+        self.result_2 = 0
+        for update_id in range(len(self.updates)):
+            self._apply(update_id, *self._classify(update_id))
+
+    def _classify(self, update_id: int) -> tuple[bool, int]:
+        """
+        Classifies an update with the current rules, without changing the results.
+
+        Args:
+            update_id (int): Position of the update in the input.
+
+        Returns:
+            tuple[bool, int]: Whether the update is valid, and its middle page once
+                              reordered.
+
+        Raises:
+            ValueError: If the rules between the pages of the update are cyclic.
+        """
+        values = self.updates[update_id]
+        if self.engine.is_valid(values):
+            return True, values[len(values) // 2]
+        return False, self.engine.reorder(values)[len(values) // 2]
+
+    def _apply(self, update_id: int, valid: bool, middle_page: int) -> None:
+        """
+        Records the classification of an update and adds its middle page to the
+        matching result.
+
+        Args:
+            update_id (int): Position of the update in the input.
+            valid (bool): Whether the update is valid.
+            middle_page (int): The middle page of the reordered update.
+        """
+        if valid:
+            self.result_1 += middle_page
+        else:
+            self.result_2 += middle_page
+
+        self.is_valid[update_id] = valid
+        self.middle_pages[update_id] = middle_page
+
+    def _reclassify(self, page_1: int, page_2: int) -> None:
+        """
+        Classifies again the updates holding both pages, then replaces their
+        previous middle page in the results. Every update is classified before any
+        result changes, so the results are left untouched if one of them fails.
+
+        Args:
+            page_1 (int): The first page of the changed rule.
+            page_2 (int): The second page of the changed rule.
+
+        Raises:
+            ValueError: If the rules between the pages of an update are cyclic.
+        """
+        affected = self.page_updates.get(page_1, set()) & self.page_updates.get(
+            page_2, set()
+        )
+        classified = [(update_id, *self._classify(update_id)) for update_id in affected]
+        for update_id, valid, middle_page in classified:
+            if self.is_valid[update_id]:
+                self.result_1 -= self.middle_pages[update_id]
+            else:
+                self.result_2 -= self.middle_pages[update_id]
+            self._apply(update_id, valid, middle_page)
+
+    def state(self) -> tuple:
+        """
+        Exports the engine as marshallable builtins, see from_state.
+
+        Returns:
+            tuple: The rules, page indices and both bitmatrices.
+        """
+        return self.successors, self.index, self.after_masks, self.before_masks
+
+    @classmethod
+    def from_state(cls, state: tuple) -> "PrecedenceEngine":
+        """
+        Rebuilds an engine exported by state without parsing the rules again.
+
+        Args:
+            state (tuple): The result of state.
+
+        Returns:
+            PrecedenceEngine: The engine.
+        """
+        engine = cls.__new__(cls)
+        engine.successors, engine.index, engine.after_masks, engine.before_masks = state
+        engine.rows = {}
+        return engine
+
+    def add_rule(self, page_1: int, page_2: int) -> None:
+        """
+        Adds the rule page_1|page_2 and updates the affected updates. If the rule
+        makes the rules between the pages of an update cyclic, it is not added.
+
+        Args:
+            page_1 (int): The page that must come first.
+            page_2 (int): The page that must come after.
+
+        Raises:
+            ValueError: If the rule creates a cycle between the pages of an update.
+        """
+        existed = self.engine.must_precede(page_1, page_2)
+        self.engine.add_rule(page_1, page_2)
+        try:
+            self._reclassify(page_1, page_2)
+        except ValueError:
+            if not existed:
+                self.engine.remove_rule(page_1, page_2)
+            raise
+
+    def remove_rule(self, page_1: int, page_2: int) -> None:
+        """
+        Removes the rule page_1|page_2 and updates the affected updates.
+
+        Args:
+            page_1 (int): The page that must come first.
+            page_2 (int): The page that must come after.
+        """
+        self.engine.remove_rule(page_1, page_2)
+        self._reclassify(page_1, page_2)
+
+
+def read_input(path: str) -> tuple[list[str], list[str]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[str], list[str]]: The page ordering rules and the updates.
+    """
+    with open(path, "r") as file:
         lines = [line.strip() for line in file]
 
     separator_index = lines.index("")
@@ -118,8 +746,13 @@ def main():
     rules = lines[:separator_index]
     updates = lines[separator_index + 1 :]
 
-    result_1 = part_1(rules, updates)
-    result_2 = part_2(rules, updates)
+    return rules, updates
+
+
+def main():
+    rules, updates = read_input(INPUT_PATH)
+
+    result_1, result_2, _ = classify_updates(rules, updates)
 
     print(f"Result 1: {result_1}")
     print(f"Result 2: {result_2}")
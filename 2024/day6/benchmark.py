@@ -0,0 +1,222 @@
+import os
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from main import (
+    DIRECTION_SYMBOLS,
+    DIRECTIONS,
+    INIT_SYMBOL,
+    ROTATE_RIGHT,
+    SENTINEL,
+    FlatGrid,
+    Grid,
+    part_1,
+    part_1_flat,
+    part_1_jumps,
+    part_2,
+    part_2_flat,
+    part_2_jumps,
+    part_2_parallel,
+    part_2_pruned,
+    read_input,
+    simulate_movement,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+
+
+def timed(func, *args) -> tuple[int, float]:
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float]: The result of the function and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_map(
+    rows: int, cols: int, density: float = 0.02, seed: int = 0
+) -> list[list[str]]:
+    """
+    Generates a random map, with the guard facing up, from which the guard
+    eventually leaves, as part_1 requires.
+
+    Args:
+        rows (int): Number of rows.
+        cols (int): Number of columns.
+        density (float): Probability of each cell being an obstacle.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list[list[str]]: The 2D grid representing the map.
+    """
+    rng = random.Random(seed)
+    while True:
+        grid = [
+            ["#" if rng.random() < density else "." for _ in range(cols)]
+            for _ in range(rows)
+        ]
+        grid[rng.randrange(rows)][rng.randrange(cols)] = INIT_SYMBOL
+        flat = FlatGrid(grid)
+        if not flat.is_loop(flat.start, DIRECTION_SYMBOLS.index(INIT_SYMBOL)):
+            return grid
+
+
+def spiral_map(size: int, gap: int = 2) -> list[list[str]]:
+    """
+    Generates a map where the guard spirals out from the center before leaving,
+    so its path covers about half of the map.
+
+    Args:
+        size (int): Number of rows and columns.
+        gap (int): Distance between two consecutive turns of the spiral.
+
+    Returns:
+        list[list[str]]: The 2D grid representing the map.
+    """
+    grid = [["."] * size for _ in range(size)]
+    x = y = size // 2
+    grid[x][y] = INIT_SYMBOL
+    direction = INIT_SYMBOL
+    length = gap
+    for leg in range(1, 4 * size):
+        dx, dy = DIRECTIONS[direction]
+        x, y = x + length * dx, y + length * dy
+        if not (0 <= x + dx < size and 0 <= y + dy < size):
+            break
+        grid[x + dx][y + dy] = "#"
+        direction = ROTATE_RIGHT[direction]
+        if leg % 2 == 0:
+            length += gap
+    return grid
+
+
+def validate(count: int, seed: int = 0) -> None:
+    """
+    Checks the optimized parts against part_1 and part_2 on small random maps.
+
+    Args:
+        count (int): Number of maps to check.
+        seed (int): Seed for the random generator.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        grid = synthetic_map(
+            rng.randint(1, 12), rng.randint(1, 12), rng.random() / 3, rng.random()
+        )
+        expected = (part_1(grid), part_2(grid))
+        assert part_1_jumps(grid) == expected[0]
+        assert part_2_jumps(grid) == expected[1]
+        assert part_2_pruned(grid) == expected[1]
+        assert part_1_flat(grid) == expected[0]
+        assert part_2_flat(grid) == expected[1]
+        assert part_2_parallel(grid, 2, chunk_size=3) == expected[1]
+
+
+def bench_part_2(name: str, grid: list[list[str]], slowest: int) -> None:
+    """
+    Times the implementations of part_2 on a map, from the fastest one.
+
+    Args:
+        name (str): Label of the map.
+        grid (list[list[str]]): The 2D grid representing the map.
+        slowest (int): Number of implementations to time, skipping the slow ones.
+    """
+    timings = []
+    expected = None
+    runs = [
+        ("pruned", part_2_pruned),
+        ("flat", part_2_flat),
+        ("jumps", part_2_jumps),
+        ("original", part_2),
+    ]
+    for label, func in runs[:slowest]:
+        result, elapsed = timed(func, grid)
+        expected = result if expected is None else expected
+        assert result == expected, label
+        timings.append(f"{label} {elapsed:.3f}s")
+
+    print(f"part_2 {name} {len(grid)}x{len(grid[0])}: {', '.join(timings)}")
+
+
+def bench_simulation_memory(grid: list[list[str]]) -> None:
+    """
+    Compares the peak memory of one loop check of part_2, which records every
+    state in a set of ints, and of the flat grid, which records turns in a
+    reused bytearray.
+
+    Args:
+        grid (list[list[str]]): The 2D grid representing the map.
+    """
+    direction = DIRECTION_SYMBOLS.index(INIT_SYMBOL)
+
+    tracemalloc.start()
+    padded = Grid(grid, border=SENTINEL)
+    simulate_movement(padded, padded.find(INIT_SYMBOL), direction)
+    _, original = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    flat = FlatGrid(grid)
+    tracemalloc.start()
+    flat.is_loop(flat.start, direction)
+    _, compact = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"simulation memory {len(grid)}x{len(grid[0])}: "
+        f"original {original / 1024:.1f}KiB, flat {compact / 1024:.1f}KiB"
+    )
+
+
+def bench_parallel(name: str, grid: list[list[str]], max_workers: int) -> None:
+    """
+    Measures the scaling of part_2_parallel from 1 to max_workers workers.
+
+    Args:
+        name (str): Label of the map.
+        grid (list[list[str]]): The 2D grid representing the map.
+        max_workers (int): Largest number of workers to measure.
+    """
+    expected, serial = None, None
+    for workers in range(1, max_workers + 1):
+        result, elapsed = timed(part_2_parallel, grid, workers)
+        expected = result if expected is None else expected
+        serial = serial or elapsed
+        assert result == expected
+
+        print(
+            f"parallel {name} {len(grid)}x{len(grid[0])} workers={workers:>2}: "
+            f"{elapsed:.3f}s (x{serial / elapsed:.2f})"
+        )
+
+
+def main():
+    (grid,) = read_input(INPUT_PATH)
+    assert part_1_jumps(grid) == part_1(grid)
+    validate(100)
+
+    bench_part_2("random", synthetic_map(60, 60, 0.05, seed=1), slowest=4)
+    bench_part_2("spiral", spiral_map(60), slowest=4)
+    bench_part_2("input", grid, slowest=3)
+    bench_part_2("spiral", spiral_map(130), slowest=3)
+    bench_part_2("spiral", spiral_map(1000), slowest=1)
+
+    max_workers = max(os.cpu_count() or 1, 2)
+    bench_parallel("input", grid, max_workers)
+    bench_parallel("spiral", spiral_map(200), max_workers)
+
+    bench_simulation_memory(grid)
+    bench_simulation_memory(spiral_map(1000))
+
+
+if __name__ == "__main__":
+    main()
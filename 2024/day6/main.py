@@ -1,5 +1,14 @@
-import copy
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from aoc.grid import ORTHOGONAL, SENTINEL, Grid  # noqa: E402
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
 DIRECTIONS = {
     "^": (-1, 0),
     ">": (0, 1),
@@ -14,6 +23,12 @@ ROTATE_RIGHT = {
 }
 INIT_SYMBOL = "^"
 
+# Cells of the map in a Grid, and directions from 0 to 3 clockwise from up
+OPEN = ord(".")
+OBSTACLE = ord("#")
+BORDER = ord(SENTINEL)
+DIRECTION_SYMBOLS = "^>v<"
+
 
 def find_start(grid: list[list[str]], symbol: str = "^") -> tuple[int, int] | None:
     """
@@ -33,56 +48,40 @@ def find_start(grid: list[list[str]], symbol: str = "^") -> tuple[int, int] | No
     return None
 
 
-def is_out_of_bounds(pos: tuple[int, int], grid: list[list[str]]) -> bool:
-    """
-    Checks if a position is outside the bounds of the grid.
-
-    Args:
-        pos (tuple[int, int]): The position to check (row, column).
-        grid (list[list[str]]): The 2D grid.
-
-    Returns:
-        bool: True if the position is out of bounds, False otherwise.
-    """
-    x, y = pos
-    return x < 0 or x >= len(grid) or y < 0 or y >= len(grid[0])
-
-
-def simulate_movement(
-    grid: list[list[str]], start_pos: tuple[int, int], start_dir: str
-) -> bool:
+def simulate_movement(grid: Grid, start: int, direction: int, extra: int = -1) -> bool:
     """
     Simulates the movement of the guard from a starting position and direction,
     and detects if it gets stuck in a loop.
 
     Args:
-        grid (list[list[str]]): The 2D grid representing the map.
-        start_pos (tuple[int, int]): The starting position of the guard (row, column).
-        start_dir (str): The starting direction of the guard ("^", ">", "v", or "<").
+        grid (Grid): The map, padded with a SENTINEL border.
+        start (int): The index of the starting cell of the guard.
+        direction (int): The starting direction of the guard, 0 to 3 clockwise
+                         from up.
+        extra (int): Index of an additional obstacle, or -1 for none.
 
     Returns:
         bool: True if the guard enters a loop, False if it exits the map.
     """
-    curr_pos = start_pos
-    curr_dir = start_dir
+    cells, offsets = grid.cells, grid.offsets(ORTHOGONAL)
+    index = start
     visited_states = set()
 
     while True:
-        state = (curr_pos, curr_dir)
+        state = index * 4 + direction
         if state in visited_states:
             return True
         visited_states.add(state)
 
-        dx, dy = DIRECTIONS[curr_dir]
-        next_pos = (curr_pos[0] + dx, curr_pos[1] + dy)
-
-        if is_out_of_bounds(next_pos, grid):
+        next_index = index + offsets[direction]
+        cell = cells[next_index]
+        if cell == BORDER:
             return False
 
-        if grid[next_pos[0]][next_pos[1]] == "#":
-            curr_dir = ROTATE_RIGHT[curr_dir]
+        if cell == OBSTACLE or next_index == extra:
+            direction = (direction + 1) & 3
         else:
-            curr_pos = next_pos
+            index = next_index
 
 
 def part_1(lines: list[list[str]]) -> int:
@@ -96,28 +95,26 @@ def part_1(lines: list[list[str]]) -> int:
     Returns:
         int: The number of positions visited.
     """
-    grid = copy.deepcopy(lines)
-    curr_pos = find_start(grid, INIT_SYMBOL)
-    if not curr_pos:
+    grid = Grid(lines, border=SENTINEL)
+    index = grid.find(INIT_SYMBOL)
+    if index < 0:
         return 0
 
-    visited = set()
-    visited.add(curr_pos)
-
-    dir = INIT_SYMBOL
+    cells, offsets = grid.cells, grid.offsets(ORTHOGONAL)
+    visited = {index}
+    direction = DIRECTION_SYMBOLS.index(INIT_SYMBOL)
 
     while True:
-        dx, dy = DIRECTIONS[dir]
-        next_pos = (curr_pos[0] + dx, curr_pos[1] + dy)
-
-        if is_out_of_bounds(next_pos, grid):
+        next_index = index + offsets[direction]
+        cell = cells[next_index]
+        if cell == BORDER:
             break
 
-        if grid[next_pos[0]][next_pos[1]] == "#":
-            dir = ROTATE_RIGHT[dir]
+        if cell == OBSTACLE:
+            direction = (direction + 1) & 3
         else:
-            curr_pos = next_pos
-            visited.add(curr_pos)
+            index = next_index
+            visited.add(index)
 
     return len(visited)
 
@@ -133,30 +130,513 @@ def part_2(lines: list[list[str]]) -> int:
     Returns:
         int: The number of positions where a new obstruction causes a loop.
     """
-    grid = copy.deepcopy(lines)
-
-    start_pos = find_start(grid, INIT_SYMBOL)
-    if not start_pos:
+    grid = Grid(lines, border=SENTINEL)
+    start = grid.find(INIT_SYMBOL)
+    if start < 0:
         return 0
 
-    start_dir = INIT_SYMBOL
+    direction = DIRECTION_SYMBOLS.index(INIT_SYMBOL)
     valid_positions = 0
 
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            if grid[i][j] == "." and (i, j) != start_pos:
-                grid[i][j] = "#"
-                if simulate_movement(grid, start_pos, start_dir):
-                    valid_positions += 1
-                grid[i][j] = "."
+    # The candidate obstacle is passed to the simulation, the map is never copied
+    for index in grid.find_all("."):
+        if simulate_movement(grid, start, direction, index):
+            valid_positions += 1
 
     return valid_positions
 
 
-def main() -> None:
-    with open("input.txt", "r") as file:
+class ObstacleMap:
+    """
+    Sorted obstacle positions of every row and column of the map, so the guard
+    can jump straight to the cell before the next obstacle in its way.
+    """
+
+    def __init__(self, grid: list[list[str]]):
+        self.rows = len(grid)
+        self.cols = len(grid[0])
+        self.row_obstacles: list[list[int]] = [[] for _ in range(self.rows)]
+        self.col_obstacles: list[list[int]] = [[] for _ in range(self.cols)]
+        for i, row in enumerate(grid):
+            for j, cell in enumerate(row):
+                if cell == "#":
+                    self.row_obstacles[i].append(j)
+                    self.col_obstacles[j].append(i)
+
+    def next_stop(
+        self,
+        pos: tuple[int, int],
+        direction: str,
+        extra: tuple[int, int] | None = None,
+    ) -> tuple[int, int] | None:
+        """
+        Finds where the guard stops walking from a position in a direction.
+
+        Args:
+            pos (tuple[int, int]): The current position of the guard (row, column).
+            direction (str): The current direction of the guard.
+            extra (tuple[int, int] | None): An additional obstacle, if any.
+
+        Returns:
+            tuple[int, int] | None: The cell just before the next obstacle, or None
+                                    if the guard leaves the map.
+        """
+        x, y = pos
+        dx, dy = DIRECTIONS[direction]
+        if dx:
+            line, coord, step = self.col_obstacles[y], x, dx
+            extra_coord = extra[0] if extra and extra[1] == y else None
+        else:
+            line, coord, step = self.row_obstacles[x], y, dy
+            extra_coord = extra[1] if extra and extra[0] == x else None
+
+        if step > 0:
+            i = bisect_right(line, coord)
+            blocker = line[i] if i < len(line) else None
+            if extra_coord is not None and coord < extra_coord:
+                if blocker is None or extra_coord < blocker:
+                    blocker = extra_coord
+        else:
+            i = bisect_left(line, coord) - 1
+            blocker = line[i] if i >= 0 else None
+            if extra_coord is not None and extra_coord < coord:
+                if blocker is None or extra_coord > blocker:
+                    blocker = extra_coord
+
+        if blocker is None:
+            return None
+        return (blocker - step, y) if dx else (x, blocker - step)
+
+    def edge(self, pos: tuple[int, int], direction: str) -> tuple[int, int]:
+        """
+        Finds the last cell of the map in a direction from a position.
+
+        Args:
+            pos (tuple[int, int]): The position (row, column).
+            direction (str): The direction.
+
+        Returns:
+            tuple[int, int]: The cell on the edge of the map.
+        """
+        x, y = pos
+        dx, dy = DIRECTIONS[direction]
+        if dx:
+            return (self.rows - 1 if dx > 0 else 0, y)
+        return (x, self.cols - 1 if dy > 0 else 0)
+
+
+def simulate_jumps(
+    obstacles: ObstacleMap,
+    start_pos: tuple[int, int],
+    start_dir: str,
+    extra: tuple[int, int] | None = None,
+) -> bool:
+    """
+    Simulates the movement of the guard obstacle to obstacle, and detects if it
+    gets stuck in a loop. Only the states where the guard turns are recorded.
+
+    Args:
+        obstacles (ObstacleMap): The obstacles of the map.
+        start_pos (tuple[int, int]): The starting position of the guard (row, column).
+        start_dir (str): The starting direction of the guard ("^", ">", "v", or "<").
+        extra (tuple[int, int] | None): An additional obstacle, if any.
+
+    Returns:
+        bool: True if the guard enters a loop, False if it exits the map.
+    """
+    curr_pos = start_pos
+    curr_dir = start_dir
+    turn_states = set()
+
+    while True:
+        curr_pos = obstacles.next_stop(curr_pos, curr_dir, extra)
+        if curr_pos is None:
+            return False
+
+        state = (curr_pos, curr_dir)
+        if state in turn_states:
+            return True
+        turn_states.add(state)
+        curr_dir = ROTATE_RIGHT[curr_dir]
+
+
+def part_1_jumps(lines: list[list[str]]) -> int:
+    """
+    Calculates the number of distinct positions visited by the guard before
+    leaving the map, jumping from obstacle to obstacle.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+
+    Returns:
+        int: The same result as part_1.
+    """
+    curr_pos = find_start(lines, INIT_SYMBOL)
+    if not curr_pos:
+        return 0
+
+    obstacles = ObstacleMap(lines)
+    curr_dir = INIT_SYMBOL
+    visited = {curr_pos}
+    turn_states = set()
+
+    while True:
+        stop = obstacles.next_stop(curr_pos, curr_dir)
+        end = stop or obstacles.edge(curr_pos, curr_dir)
+
+        dx, dy = DIRECTIONS[curr_dir]
+        x, y = curr_pos
+        steps = abs(end[0] - x) + abs(end[1] - y)
+        visited.update((x + k * dx, y + k * dy) for k in range(1, steps + 1))
+
+        if stop is None or (stop, curr_dir) in turn_states:
+            return len(visited)
+        turn_states.add((stop, curr_dir))
+        curr_pos = stop
+        curr_dir = ROTATE_RIGHT[curr_dir]
+
+
+def part_2_jumps(lines: list[list[str]]) -> int:
+    """
+    Determines how many positions can be obstructed to make the guard get stuck
+    in a loop, simulating every candidate obstacle with jumps.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    start_pos = find_start(lines, INIT_SYMBOL)
+    if not start_pos:
+        return 0
+
+    obstacles = ObstacleMap(lines)
+    return sum(
+        1
+        for i, row in enumerate(lines)
+        for j, cell in enumerate(row)
+        if cell == "."
+        and (i, j) != start_pos
+        and simulate_jumps(obstacles, start_pos, INIT_SYMBOL, (i, j))
+    )
+
+
+def first_arrivals(
+    obstacles: ObstacleMap, start_pos: tuple[int, int], start_dir: str
+) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+    """
+    Walks the original path of the guard and records, for every cell it visits
+    after the start, the state just before it first steps into that cell.
+
+    Args:
+        obstacles (ObstacleMap): The obstacles of the map.
+        start_pos (tuple[int, int]): The starting position of the guard (row, column).
+        start_dir (str): The starting direction of the guard ("^", ">", "v", or "<").
+
+    Returns:
+        list[tuple[tuple[int, int], tuple[int, int], str]]: The visited cells, in
+            order of first arrival, with the position and direction of the guard
+            just before entering them.
+    """
+    arrivals = []
+    seen = {start_pos}
+    turn_states = set()
+    curr_pos, curr_dir = start_pos, start_dir
+
+    while True:
+        stop = obstacles.next_stop(curr_pos, curr_dir)
+        end = stop or obstacles.edge(curr_pos, curr_dir)
+
+        dx, dy = DIRECTIONS[curr_dir]
+        prev_pos = curr_pos
+        while prev_pos != end:
+            cell = (prev_pos[0] + dx, prev_pos[1] + dy)
+            if cell not in seen:
+                seen.add(cell)
+                arrivals.append((cell, prev_pos, curr_dir))
+            prev_pos = cell
+
+        if stop is None or (stop, curr_dir) in turn_states:
+            return arrivals
+        turn_states.add((stop, curr_dir))
+        curr_pos = stop
+        curr_dir = ROTATE_RIGHT[curr_dir]
+
+
+def part_2_pruned(lines: list[list[str]]) -> int:
+    """
+    Determines how many positions can be obstructed to make the guard get stuck
+    in a loop. An obstacle off the original path never meets the guard, so only
+    the cells of the path are tried, and the guard walks the original path until
+    it first reaches the candidate, so each check resumes from that state.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    start_pos = find_start(lines, INIT_SYMBOL)
+    if not start_pos:
+        return 0
+
+    obstacles = ObstacleMap(lines)
+    return sum(
+        1
+        for cell, prev_pos, prev_dir in first_arrivals(
+            obstacles, start_pos, INIT_SYMBOL
+        )
+        if simulate_jumps(obstacles, prev_pos, prev_dir, cell)
+    )
+
+
+class FlatGrid(Grid):
+    """
+    Map padded with a border of sentinel cells, so the guard leaving the map is
+    found without bounds checks. The starting cell is stored as open, a direction
+    is an integer from 0 to 3, and a guard state the integer index * 4 + direction.
+    """
+
+    __slots__ = ("start", "states")
+
+    def __init__(self, lines: list[list[str]]):
+        super().__init__(lines, border=SENTINEL)
+        self.start = self.find(INIT_SYMBOL)
+        if self.start >= 0:
+            self.cells[self.start] = OPEN
+        # Reused by every simulation and cleared through the states it set
+        self.states = bytearray(len(self.cells) * 4)
+
+    @classmethod
+    def from_buffer(cls, cells, rows: int, cols: int, start: int) -> "FlatGrid":
+        """
+        Wraps an existing buffer of cells, such as shared memory, without copying it.
+
+        Args:
+            cells: A bytes-like buffer laid out as FlatGrid.cells.
+            rows (int): Number of rows of the map.
+            cols (int): Number of columns of the map.
+            start (int): Index of the starting cell of the guard.
+
+        Returns:
+            FlatGrid: A grid reading its cells from the buffer.
+        """
+        grid = super().from_buffer(cells, rows, cols, padding=1)
+        grid.start = start
+        grid.states = bytearray(len(cells) * 4)
+        return grid
+
+    def is_loop(self, index: int, direction: int, extra: int = -1) -> bool:
+        """
+        Simulates the guard from a state and detects if it gets stuck in a loop,
+        recording only the states where it turns.
+
+        Args:
+            index (int): The starting cell of the guard.
+            direction (int): The starting direction of the guard.
+            extra (int): Index of an additional obstacle, or -1 for none.
+
+        Returns:
+            bool: True if the guard enters a loop, False if it exits the map.
+        """
+        cells, offsets, states = self.cells, self.offsets(ORTHOGONAL), self.states
+        touched = []
+        step = offsets[direction]
+        looped = False
+        while True:
+            next_index = index + step
+            cell = cells[next_index]
+            if cell == OPEN and next_index != extra:
+                index = next_index
+            elif cell == BORDER:
+                break
+            else:
+                state = index * 4 + direction
+                if states[state]:
+                    looped = True
+                    break
+                states[state] = 1
+                touched.append(state)
+                direction = (direction + 1) & 3
+                step = offsets[direction]
+
+        for state in touched:
+            states[state] = 0
+        return looped
+
+    def first_arrivals(self) -> list[tuple[int, int, int]]:
+        """
+        Walks the original path of the guard and records, for every cell it
+        visits after the start, the state just before it first enters the cell.
+
+        Returns:
+            list[tuple[int, int, int]]: The visited cells, in order of first
+                                        arrival, with the cell and direction of
+                                        the guard just before entering them.
+        """
+        cells, offsets = self.cells, self.offsets(ORTHOGONAL)
+        seen = bytearray(len(cells))
+        seen[self.start] = 1
+        turn_states = set()
+        arrivals = []
+        index, direction = self.start, DIRECTION_SYMBOLS.index(INIT_SYMBOL)
+        while True:
+            next_index = index + offsets[direction]
+            cell = cells[next_index]
+            if cell == BORDER:
+                return arrivals
+            if cell == OBSTACLE:
+                state = index * 4 + direction
+                if state in turn_states:
+                    return arrivals
+                turn_states.add(state)
+                direction = (direction + 1) & 3
+                continue
+            if not seen[next_index]:
+                seen[next_index] = 1
+                arrivals.append((next_index, index, direction))
+            index = next_index
+
+
+def part_1_flat(lines: list[list[str]]) -> int:
+    """
+    Calculates the number of distinct positions visited by the guard before
+    leaving the map, on the flat grid.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+
+    Returns:
+        int: The same result as part_1.
+    """
+    grid = FlatGrid(lines)
+    if grid.start < 0:
+        return 0
+    return len(grid.first_arrivals()) + 1
+
+
+def part_2_flat(lines: list[list[str]]) -> int:
+    """
+    Determines how many positions can be obstructed to make the guard get stuck
+    in a loop, on the flat grid. As in part_2_pruned, only the cells of the
+    original path are tried, resuming from the guard's state before each one,
+    and the candidate obstacle is passed to the simulation instead of being
+    written into the map.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    grid = FlatGrid(lines)
+    if grid.start < 0:
+        return 0
+    return sum(
+        1
+        for cell, index, direction in grid.first_arrivals()
+        if grid.is_loop(index, direction, cell)
+    )
+
+
+# Per-process state of the part_2_parallel workers
+_worker_memory: shared_memory.SharedMemory | None = None
+_worker_grid: FlatGrid | None = None
+
+
+def _init_worker(name: str, rows: int, cols: int, start: int) -> None:
+    """
+    Attaches a worker process to the shared map.
+
+    Args:
+        name (str): Name of the shared memory block holding the cells.
+        rows (int): Number of rows of the map.
+        cols (int): Number of columns of the map.
+        start (int): Index of the starting cell of the guard.
+    """
+    global _worker_memory, _worker_grid
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_grid = FlatGrid.from_buffer(_worker_memory.buf, rows, cols, start)
+
+
+def _count_loops(candidates: list[tuple[int, int, int]]) -> int:
+    """
+    Counts the candidate obstacles of a chunk that make the guard loop.
+
+    Args:
+        candidates (list[tuple[int, int, int]]): Candidate cells with the cell and
+                                                 direction of the guard before them.
+
+    Returns:
+        int: The number of candidates that cause a loop.
+    """
+    return sum(
+        1
+        for cell, index, direction in candidates
+        if _worker_grid.is_loop(index, direction, cell)
+    )
+
+
+def part_2_parallel(
+    lines: list[list[str]], workers: int | None = None, chunk_size: int = 256
+) -> int:
+    """
+    Determines how many positions can be obstructed to make the guard get stuck
+    in a loop, checking the candidates of part_2_flat in a process pool. The map
+    is put in shared memory once and every worker attaches to it; the candidate
+    obstacle is a parameter of the simulation, so the map is never modified.
+
+    Args:
+        lines (list[list[str]]): The 2D grid representing the map.
+        workers (int | None): Number of worker processes, all the CPUs by default.
+        chunk_size (int): Number of candidates sent to a worker at a time.
+
+    Returns:
+        int: The same result as part_2.
+    """
+    grid = FlatGrid(lines)
+    if grid.start < 0:
+        return 0
+
+    candidates = grid.first_arrivals()
+    chunks = [
+        candidates[i : i + chunk_size] for i in range(0, len(candidates), chunk_size)
+    ]
+
+    memory = shared_memory.SharedMemory(create=True, size=len(grid.cells))
+    try:
+        memory.buf[: len(grid.cells)] = grid.cells
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count() or 1,
+            initializer=_init_worker,
+            initargs=(memory.name, grid.rows, grid.cols, grid.start),
+        ) as executor:
+            return sum(executor.map(_count_loops, chunks))
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def read_input(path: str) -> tuple[list[list[str]]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[list[str]]]: The 2D grid representing the map.
+    """
+    with open(path, "r") as file:
         lines = [list(line.strip()) for line in file]
 
+    return (lines,)
+
+
+def main() -> None:
+    (lines,) = read_input(INPUT_PATH)
+
     result_1 = part_1(lines)
     result_2 = part_2(lines)
 
@@ -0,0 +1,176 @@
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from main import (
+    evaluate_expression,
+    get_calibration_results_parallel,
+    get_total_calibration_result,
+    is_solvable,
+    is_solvable_backward,
+    is_solvable_forward,
+)
+
+INPUT_PATH = Path(__file__).parent / "input.txt"
+OPERATOR_SETS = (["+", "*"], ["+", "*", "||"])
+
+
+def timed(func, *args) -> tuple[int, float]:
+    """
+    Runs a function once and measures its wall-clock time.
+
+    Args:
+        func: The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        tuple[int, float]: The result of the function and the elapsed seconds.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_lines(
+    count: int, length: int, operators: list[str], seed: int = 0
+) -> list[str]:
+    """
+    Generates calibration lines, half of them built from random operators so
+    they are solvable and half of them with a nearby test value.
+
+    Args:
+        count (int): Number of lines.
+        length (int): Number of operands per line.
+        operators (list[str]): Operators used to build the solvable lines.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list[str]: The lines, in the format "test_value: nums".
+    """
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        nums = [rng.randint(1, 20) for _ in range(length)]
+        combination = tuple(rng.choice(operators) for _ in range(length - 1))
+        test_value = evaluate_expression(nums, combination) + i % 2
+        lines.append(f"{test_value}: {' '.join(map(str, nums))}\n")
+    return lines
+
+
+def validate(count: int, seed: int = 0) -> None:
+    """
+    Checks the backward and forward solvers against is_solvable on small random equations,
+    including zeros and test values close to reachable ones.
+
+    Args:
+        count (int): Number of equations to check.
+        seed (int): Seed for the random generator.
+    """
+    rng = random.Random(seed)
+    for _ in range(count):
+        nums = [rng.randint(0, 12) for _ in range(rng.randint(1, 6))]
+        for operators in OPERATOR_SETS:
+            combination = tuple(rng.choice(operators) for _ in range(len(nums) - 1))
+            test_value = evaluate_expression(nums, combination) + rng.randint(-1, 1)
+            expected = is_solvable(test_value, nums, operators)
+            for solver in (is_solvable_backward, is_solvable_forward):
+                assert solver(test_value, nums, operators) == expected, (
+                    solver.__name__,
+                    test_value,
+                    nums,
+                    operators,
+                )
+
+
+def bench_solver(name: str, lines: list[str], solvers: list) -> None:
+    """
+    Times the total calibration result of both operator sets with several solvers.
+
+    Args:
+        name (str): Label of the lines.
+        lines (list[str]): The calibration lines.
+        solvers (list): The solvers to time, checked against the first one.
+    """
+    timings = []
+    expected = None
+    for solver in solvers:
+        start = time.perf_counter()
+        result = [
+            get_total_calibration_result(lines, operators, solver)
+            for operators in OPERATOR_SETS
+        ]
+        elapsed = time.perf_counter() - start
+        expected = result if expected is None else expected
+        assert result == expected, solver.__name__
+        timings.append(f"{solver.__name__} {elapsed:.3f}s")
+
+    print(f"calibration {name}: {', '.join(timings)}")
+
+
+def bench_parallel(lines: list[str], max_workers: int, chunk_size: int) -> None:
+    """
+    Measures the scaling of the streaming process pool from 1 to max_workers
+    workers, against one solve per operator set on a single core.
+
+    Args:
+        lines (list[str]): The calibration lines.
+        max_workers (int): Largest number of workers to measure.
+        chunk_size (int): Number of lines sent to a worker at a time.
+    """
+    start = time.perf_counter()
+    expected = tuple(
+        get_total_calibration_result(lines, operators, is_solvable_backward)
+        for operators in OPERATOR_SETS
+    )
+    serial = time.perf_counter() - start
+    print(f"parallel {len(lines)} lines serial: {serial:.3f}s")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as file:
+        file.writelines(lines)
+        file.flush()
+        for workers in range(1, max_workers + 1):
+            result, elapsed = timed(
+                get_calibration_results_parallel, file.name, workers, chunk_size
+            )
+            assert result == expected
+
+            print(
+                f"parallel {len(lines)} lines workers={workers:>2}: "
+                f"{elapsed:.3f}s (x{serial / elapsed:.2f})"
+            )
+
+
+def main():
+    with open(INPUT_PATH, "r") as file:
+        lines = file.readlines()
+    validate(20_000)
+
+    solvers = [is_solvable_backward, is_solvable_forward]
+    bench_solver("input", lines, solvers)
+    bench_solver(
+        "8 operands",
+        synthetic_lines(1_000, 8, OPERATOR_SETS[1]),
+        solvers + [is_solvable],
+    )
+    for length in (20, 30):
+        bench_solver(
+            f"{length} operands",
+            synthetic_lines(1_000, length, OPERATOR_SETS[1]),
+            [is_solvable_backward],
+        )
+
+    assert get_calibration_results_parallel(INPUT_PATH, 2, 7) == tuple(
+        get_total_calibration_result(lines, operators, is_solvable_backward)
+        for operators in OPERATOR_SETS
+    )
+    bench_parallel(
+        synthetic_lines(20_000, 12, OPERATOR_SETS[1]),
+        max(os.cpu_count() or 1, 2),
+        chunk_size=512,
+    )
+
+
+if __name__ == "__main__":
+    main()
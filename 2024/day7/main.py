@@ -1,4 +1,13 @@
-from itertools import product
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, product
+
+INPUT_PATH = os.path.join(os.path.dirname(__file__), "input.txt")
+OP_ADD = 0
+OP_MUL = 1
+OP_CONCAT = 2
+OPERATOR_CODES = {"+": OP_ADD, "*": OP_MUL, "||": OP_CONCAT}
 
 
 def evaluate_expression(nums: list[int], operator_combinations: tuple[str, ...]) -> int:
@@ -42,13 +51,119 @@ def is_solvable(test_value: int, nums: list[int], operators: list[str]) -> bool:
     return False
 
 
-def get_total_calibration_result(lines: list[str], operators: list[str]) -> int:
+def is_solvable_backward(
+    test_value: int, nums: list[int], operators: list[str]
+) -> bool:
+    """
+    Determines if a test value can be produced by combining the numbers with the given operators,
+    undoing the operators from the last number backwards: '+' subtracts, '*' divides when the
+    division is exact and '||' strips a matching decimal suffix. Every impossible undo prunes
+    its branch immediately, so the search rarely explores more than a few paths.
+
+    Args:
+        test_value (int): The target value to match.
+        nums (list[int]): List of non-negative numbers to use in the equation.
+        operators (list[str]): List of allowed operators ('+', '*', or '||').
+
+    Returns:
+        bool: True if the test value can be produced, False otherwise.
+    """
+    use_add = "+" in operators
+    use_mul = "*" in operators
+    use_concat = "||" in operators
+
+    def solve(target: int, i: int) -> bool:
+        num = nums[i]
+        if i == 0:
+            return target == num
+
+        if use_mul:
+            if num == 0:
+                if target == 0:
+                    return True
+            elif target % num == 0 and solve(target // num, i - 1):
+                return True
+        if use_concat and target >= num:
+            power = 10 ** len(str(num))
+            if (target - num) % power == 0 and solve((target - num) // power, i - 1):
+                return True
+        return use_add and target >= num and solve(target - num, i - 1)
+
+    return solve(test_value, len(nums) - 1)
+
+
+def concat_power(num: int) -> int:
+    """
+    Computes the power of 10 that shifts a value left by the digits of num, so that
+    value || num is value * concat_power(num) + num.
+
+    Args:
+        num (int): A non-negative number.
+
+    Returns:
+        int: 10 raised to the number of decimal digits of num.
+    """
+    power = 10
+    while power <= num:
+        power *= 10
+    return power
+
+
+def is_solvable_forward(test_value: int, nums: list[int], operators: list[str]) -> bool:
+    """
+    Determines if a test value can be produced by combining the numbers with the given operators,
+    keeping the set of values reachable after each number. Every operator is non-decreasing on
+    non-negative numbers, except multiplying by 0, so values above the test value are dropped
+    once no 0 is left to multiply by.
+
+    Args:
+        test_value (int): The target value to match.
+        nums (list[int]): List of non-negative numbers to use in the equation.
+        operators (list[str]): List of allowed operators ('+', '*', or '||').
+
+    Returns:
+        bool: True if the test value can be produced, False otherwise.
+    """
+    codes = sorted({OPERATOR_CODES[op] for op in operators})
+    last_zero = 0
+    if OP_MUL in codes:
+        last_zero = max((i for i, num in enumerate(nums) if num == 0), default=0)
+
+    reachable = {nums[0]}
+    for i in range(1, len(nums)):
+        num = nums[i]
+        power = concat_power(num)
+        limit = test_value if i >= last_zero else None
+
+        next_reachable = set()
+        for value in reachable:
+            for code in codes:
+                if code == OP_ADD:
+                    result = value + num
+                elif code == OP_MUL:
+                    result = value * num
+                else:
+                    result = value * power + num
+                if limit is None or result <= limit:
+                    next_reachable.add(result)
+
+        if not next_reachable:
+            return False
+        reachable = next_reachable
+
+    return test_value in reachable
+
+
+def get_total_calibration_result(
+    lines: list[str], operators: list[str], solver=is_solvable
+) -> int:
     """
     Calculates the total calibration result by summing test values that can be solved with the given operators.
 
     Args:
         lines (list[str]): List of input lines, where each line is in the format "test_value: nums".
         operators (list[str]): List of allowed operators ('+', '*', or '||').
+        solver: Function deciding if an equation is solvable, is_solvable by default.
 
     Returns:
         int: The total calibration result.
@@ -58,11 +173,84 @@ def get_total_calibration_result(lines: list[str], operators: list[str]) -> int:
         parts = line.split(":")
         test_value = int(parts[0].strip())
         nums = list(map(int, parts[1].strip().split()))
-        if is_solvable(test_value, nums, operators):
+        if solver(test_value, nums, operators):
             result += test_value
     return result
 
 
+def get_total_calibration_result_forward(lines: list[str], operators: list[str]) -> int:
+    """
+    Calculates the total calibration result like get_total_calibration_result, evaluating the
+    equations forward with arithmetic concatenation and pruned sets of reachable values.
+
+    Args:
+        lines (list[str]): List of input lines, where each line is in the format "test_value: nums".
+        operators (list[str]): List of allowed operators ('+', '*', or '||').
+
+    Returns:
+        int: The total calibration result.
+    """
+    return get_total_calibration_result(lines, operators, is_solvable_forward)
+
+
+def solve_calibration_chunk(lines: list[str]) -> tuple[int, int]:
+    """
+    Solves a chunk of lines for both operator sets in a single visit per line. A line solvable
+    with '+' and '*' is also solvable once '||' is allowed, so it is not searched again.
+
+    Args:
+        lines (list[str]): List of input lines, where each line is in the format "test_value: nums".
+
+    Returns:
+        tuple[int, int]: The partial calibration results of part_1 and part_2.
+    """
+    result_1 = 0
+    result_2 = 0
+    for line in lines:
+        parts = line.split(":")
+        test_value = int(parts[0].strip())
+        nums = list(map(int, parts[1].strip().split()))
+        if is_solvable_backward(test_value, nums, ["+", "*"]):
+            result_1 += test_value
+            result_2 += test_value
+        elif is_solvable_backward(test_value, nums, ["+", "*", "||"]):
+            result_2 += test_value
+    return result_1, result_2
+
+
+def get_calibration_results_parallel(
+    path: str, workers: int | None = None, chunk_size: int = 1024
+) -> tuple[int, int]:
+    """
+    Calculates both calibration results streaming the lines of a file in chunks to a process pool.
+    At most two chunks per worker are in flight, so memory does not grow with the file.
+
+    Args:
+        path (str): Path to the input file.
+        workers (int | None): Number of worker processes, all the CPUs by default.
+        chunk_size (int): Number of lines sent to a worker at a time.
+
+    Returns:
+        tuple[int, int]: The same results as part_1 and part_2.
+    """
+    workers = workers or os.cpu_count() or 1
+    result_1 = 0
+    result_2 = 0
+    with open(path, "r") as file, ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        while True:
+            chunk = list(islice(file, chunk_size))
+            lines = [line for line in chunk if line.strip()]
+            if lines:
+                pending.append(executor.submit(solve_calibration_chunk, lines))
+            if pending and (len(pending) >= 2 * workers or not chunk):
+                partial_1, partial_2 = pending.popleft().result()
+                result_1 += partial_1
+                result_2 += partial_2
+            elif not chunk:
+                return result_1, result_2
+
+
 def part_1(lines: list[str]) -> int:
     """
     Calculates the total calibration result by summing test values that can be solved using '+' and '*'.
@@ -89,10 +277,25 @@ def part_2(lines: list[str]) -> int:
     return get_total_calibration_result(lines, ["+", "*", "||"])
 
 
-def main():
-    with open("input.txt", "r") as file:
+def read_input(path: str) -> tuple[list[str]]:
+    """
+    Reads and parses the puzzle input into the arguments of part_1 and part_2.
+
+    Args:
+        path (str): Path to the input file.
+
+    Returns:
+        tuple[list[str]]: The calibration lines.
+    """
+    with open(path, "r") as file:
         lines = file.readlines()
 
+    return (lines,)
+
+
+def main():
+    (lines,) = read_input(INPUT_PATH)
+
     result_1 = part_1(lines)
     result_2 = part_2(lines)
     print(f"Result 1: {result_1}")
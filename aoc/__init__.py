@@ -0,0 +1,3 @@
+"""
+Tools to run and measure the AdventOfCode solutions of every year.
+"""
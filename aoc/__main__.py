@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import sys
+
+from aoc.bench import (
+    find_regressions,
+    format_report,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+from aoc.generators import GENERATORS
+from aoc.runner import day_directory, format_table, parse_days, run_day
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+def select_days(parser: argparse.ArgumentParser, args: argparse.Namespace) -> list[int]:
+    """
+    Parses the --day option, reporting unknown days and malformed selections as
+    usage errors.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser reporting the errors.
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        list[int]: The selected days.
+    """
+    try:
+        days = parse_days(args.day)
+    except ValueError:
+        parser.error(f'argument --day: invalid selection "{args.day}"')
+    if not days:
+        parser.error(f'argument --day: no day selected by "{args.day}"')
+
+    for day in days:
+        if not os.path.isfile(os.path.join(day_directory(args.year, day), "main.py")):
+            parser.error(f"argument --day: no solution for {args.year} day {day}")
+        if args.command == "bench" and day not in GENERATORS.get(args.year, {}):
+            parser.error(f"argument --day: no generator for {args.year} day {day}")
+    return days
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run and measure AdventOfCode solutions."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the parsing and both parts of days")
+    run.add_argument("--year", type=int, default=2024)
+    run.add_argument("--day", default="1-7", help='days to run, e.g. "1-7" or "1,3"')
+    run.add_argument("--input", help="input file, the input.txt of each day by default")
+    run.add_argument(
+        "--repeat", type=positive_int, default=1, help="timed runs per stage"
+    )
+    run.add_argument(
+        "--warmup", type=non_negative_int, default=0, help="untimed runs per stage"
+    )
+    run.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc peak memory run"
+    )
+    run.add_argument(
+        "--cache",
+        action="store_true",
+        help="load parsed inputs from the cache instead of timing the parsers",
+    )
+    run.add_argument("--json", help='write the measurements as JSON, "-" for stdout')
+
+    bench = commands.add_parser(
+        "bench", help="time every part on synthetic inputs of growing scale"
+    )
+    bench.add_argument("--year", type=int, default=2024)
+    bench.add_argument("--day", default="1-7", help='days to run, e.g. "1-7" or "1,3"')
+    bench.add_argument(
+        "--scales",
+        default="0.1,1,10,100,1000",
+        help="comma-separated input size multipliers",
+    )
+    bench.add_argument(
+        "--repeat", type=positive_int, default=5, help="timed runs per stage"
+    )
+    bench.add_argument(
+        "--warmup", type=non_negative_int, default=1, help="untimed runs per stage"
+    )
+    bench.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help="seconds after which a part is not run on larger scales",
+    )
+    bench.add_argument("--seed", type=int, default=0, help="seed of the generators")
+    bench.add_argument("--baseline", help="JSON baseline to compare with")
+    bench.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 for 25%%"
+    )
+    bench.add_argument("--save", help="write the timings as a JSON baseline")
+
+    args = parser.parse_args(argv)
+    days = select_days(parser, args)
+    if args.command == "bench":
+        return bench_command(args, days)
+
+    if args.input and len(days) > 1:
+        parser.error("argument --input: only allowed when a single day is selected")
+
+    measurements = []
+    for day in days:
+        measurements += run_day(
+            args.year,
+            day,
+            args.input,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            trace_memory=not args.no_memory,
+            cached=args.cache,
+        )
+
+    records = [measurement.to_dict() for measurement in measurements]
+    if args.json == "-":
+        json.dump(records, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(measurements))
+        if args.json:
+            with open(args.json, "w") as file:
+                json.dump(records, file, indent=2)
+
+    return 0
+
+
+def bench_command(args: argparse.Namespace, days: list[int]) -> int:
+    records = run_suite(
+        args.year,
+        days,
+        [float(scale) for scale in args.scales.split(",")],
+        repeat=args.repeat,
+        warmup=args.warmup,
+        budget=args.budget,
+        seed=args.seed,
+    )
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    print(format_report(records, baseline))
+    if args.save:
+        save_baseline(records, args.save)
+
+    if baseline is None:
+        return 0
+
+    regressions = find_regressions(records, baseline, args.threshold)
+    for record, previous in regressions:
+        print(
+            f"REGRESSION {record.key}: {record.best:.6f}s vs {previous.best:.6f}s, "
+            f"result {record.result} vs {previous.result}"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+import gc
+import json
+import math
+import os
+import statistics
+import tempfile
+import time
+from typing import NamedTuple
+
+from aoc.cache import bypass
+from aoc.generators import generate
+from aoc.runner import PARTS, format_seconds, load_day
+
+# Timings below this are too noisy to flag as regressions
+MIN_COMPARABLE_SECONDS = 5e-3
+
+
+class BenchmarkRecord(NamedTuple):
+    """
+    Timing of one stage of a day on a synthetic input of a given scale: the best
+    of its runs, and how far the median run was above it.
+    """
+
+    year: int
+    day: int
+    scale: float
+    stage: str
+    result: int | None
+    best: float
+    noise: float = 0.0
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}/day{self.day}/{self.stage}@{self.scale:g}"
+
+
+def time_stage(
+    func, args: tuple, repeat: int, warmup: int, budget: float
+) -> tuple[object, list[float]]:
+    """
+    Times a function after some warmup runs. Runs stop early once they add up to
+    more than the budget, and a warmup run over the budget is kept as the only
+    timing, since warming up does not matter for runs that long.
+
+    Args:
+        func: The function to time.
+        args (tuple): The arguments passed to the function.
+        repeat (int): Maximum number of timed runs.
+        warmup (int): Number of runs before the timed ones.
+        budget (float): Time in seconds after which no more runs start.
+
+    Returns:
+        tuple[object, list[float]]: The result of the last run and the time of
+                                    every timed run.
+    """
+    times: list[float] = []
+    for run in range(warmup + repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        if run >= warmup or elapsed > budget:
+            times.append(elapsed)
+        if sum(times) > budget:
+            break
+    return result, times
+
+
+def make_record(
+    year: int, day: int, scale: float, stage: str, result, times: list[float]
+) -> BenchmarkRecord:
+    """
+    Summarizes the timed runs of a stage.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        scale (float): The scale of the input.
+        stage (str): "parse" or the name of the part.
+        result: The result of the stage, kept only if it is an int.
+        times (list[float]): The time of every timed run.
+
+    Returns:
+        BenchmarkRecord: The best time and the noise of the runs.
+    """
+    best = min(times)
+    result = result if isinstance(result, int) else None
+    noise = statistics.median(times) - best
+    return BenchmarkRecord(year, day, scale, stage, result, best, noise)
+
+
+def run_suite(
+    year: int,
+    days: list[int],
+    scales: list[float],
+    repeat: int = 5,
+    warmup: int = 1,
+    budget: float = 10.0,
+    seed: int = 0,
+) -> list[BenchmarkRecord]:
+    """
+    Runs the parsing and both parts of every day on synthetic inputs of growing
+    scale, with the parsed-input cache bypassed. Once a part takes longer than
+    the budget, it is skipped for the larger scales, so slow hot paths show
+    their growth without stalling the suite.
+
+    Args:
+        year (int): The year of the puzzles.
+        days (list[int]): The days to run.
+        scales (list[float]): The size multipliers of the inputs, in increasing order.
+        repeat (int): Number of timed runs per stage, the best one is kept.
+        warmup (int): Number of untimed runs per stage before the timed ones.
+        budget (float): Time in seconds above which a part stops growing.
+        seed (int): Seed for the input generators.
+
+    Returns:
+        list[BenchmarkRecord]: The timings of every stage that ran.
+    """
+    records = []
+    with bypass():
+        for day in days:
+            module = load_day(year, day)
+            active = list(PARTS)
+            for scale in scales:
+                if not active:
+                    break
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    path = os.path.join(tmp_dir, "input.txt")
+                    with open(path, "w") as file:
+                        file.write(generate(year, day, scale, seed))
+
+                    args, times = time_stage(
+                        module.read_input, (path,), repeat, warmup, budget
+                    )
+                    records.append(make_record(year, day, scale, "parse", None, times))
+                    for part in list(active):
+                        result, times = time_stage(
+                            getattr(module, part), args, repeat, warmup, budget
+                        )
+                        records.append(
+                            make_record(year, day, scale, part, result, times)
+                        )
+                        if min(times) > budget:
+                            active.remove(part)
+
+    return records
+
+
+def save_baseline(records: list[BenchmarkRecord], path: str) -> None:
+    """
+    Saves the records as a JSON baseline.
+
+    Args:
+        records (list[BenchmarkRecord]): The records to save.
+        path (str): Path to the JSON file.
+    """
+    with open(path, "w") as file:
+        json.dump([record._asdict() for record in records], file, indent=2)
+
+
+def load_baseline(path: str) -> dict[str, BenchmarkRecord]:
+    """
+    Loads a JSON baseline saved by save_baseline.
+
+    Args:
+        path (str): Path to the JSON file.
+
+    Returns:
+        dict[str, BenchmarkRecord]: The records, by key.
+    """
+    with open(path, "r") as file:
+        records = [BenchmarkRecord(**record) for record in json.load(file)]
+    return {record.key: record for record in records}
+
+
+def find_regressions(
+    records: list[BenchmarkRecord],
+    baseline: dict[str, BenchmarkRecord],
+    threshold: float,
+) -> list[tuple[BenchmarkRecord, BenchmarkRecord]]:
+    """
+    Finds the records whose result changed, or whose best time is slower than
+    their baseline by more than the threshold plus twice the noise of either
+    measurement. Timings below MIN_COMPARABLE_SECONDS are never flagged.
+
+    Args:
+        records (list[BenchmarkRecord]): The new records.
+        baseline (dict[str, BenchmarkRecord]): The baseline records, by key.
+        threshold (float): Allowed relative slowdown, 0.25 for 25%.
+
+    Returns:
+        list[tuple[BenchmarkRecord, BenchmarkRecord]]: The regressed records with
+                                                       their baseline.
+    """
+    regressions = []
+    for record in records:
+        previous = baseline.get(record.key)
+        if previous is None:
+            continue
+        if record.result != previous.result:
+            regressions.append((record, previous))
+        elif max(record.best, previous.best) >= MIN_COMPARABLE_SECONDS:
+            noise = max(record.noise, previous.noise)
+            if record.best > previous.best * (1 + threshold) + 2 * noise:
+                regressions.append((record, previous))
+    return regressions
+
+
+def format_report(
+    records: list[BenchmarkRecord], baseline: dict[str, BenchmarkRecord] | None = None
+) -> str:
+    """
+    Formats the records as a table. The growth column is the exponent k such that
+    the time grows like scale**k since the previous scale of the same stage.
+
+    Args:
+        records (list[BenchmarkRecord]): The records to show.
+        baseline (dict[str, BenchmarkRecord] | None): Baseline to compare with.
+
+    Returns:
+        str: The table, one line per record.
+    """
+    header = f"{'day':>3} {'stage':<7} {'scale':>6} {'result':>20} {'best':>10} "
+    header += f"{'growth':>7} {'baseline':>10}"
+    rows = [header, "-" * len(header)]
+    previous: dict[tuple[int, str], BenchmarkRecord] = {}
+    for record in records:
+        growth = ""
+        before = previous.get((record.day, record.stage))
+        if before and before.best > 0 and record.best > 0:
+            exponent = math.log(record.best / before.best) / math.log(
+                record.scale / before.scale
+            )
+            growth = f"{exponent:.2f}"
+        previous[(record.day, record.stage)] = record
+
+        compared = ""
+        if baseline and record.key in baseline:
+            compared = f"x{record.best / baseline[record.key].best:.2f}"
+
+        result = "" if record.result is None else str(record.result)
+        rows.append(
+            f"{record.day:>3} {record.stage:<7} {record.scale:>6g} {result:>20} "
+            f"{format_seconds(record.best):>10} {growth:>7} {compared:>10}"
+        )
+    return "\n".join(rows)
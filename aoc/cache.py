@@ -0,0 +1,175 @@
+import contextlib
+import functools
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+
+CACHE_DIR = os.environ.get(
+    "AOC_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"),
+)
+# Entries kept per parser, the least recently used ones are evicted first
+MAX_ENTRIES = 4
+# Cleared by bypass, to time the parsers instead of cache hits
+ENABLED = True
+
+
+@contextlib.contextmanager
+def bypass() -> Iterator[None]:
+    """
+    Disables the cache inside a with block: every call parses its input again and
+    nothing is read from or written to the cache directory.
+    """
+    global ENABLED
+    previous, ENABLED = ENABLED, False
+    try:
+        yield
+    finally:
+        ENABLED = previous
+
+
+def cache_key(content: bytes, version: int) -> str:
+    """
+    Hashes an input file together with everything that changes the cached
+    structure: the parser version and the marshal format of this Python.
+
+    Args:
+        content (bytes): The raw content of the input file.
+        version (int): The version of the parser.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    digest = hashlib.blake2b(content, digest_size=16)
+    digest.update(f"{version}:{marshal.version}:{sys.version_info[:2]}".encode())
+    return digest.hexdigest()
+
+
+def evict(name: str, version: int, keep: str) -> None:
+    """
+    Removes the entries of a parser written by another parser version, and the
+    least recently used ones beyond MAX_ENTRIES.
+
+    Args:
+        name (str): The name of the parser.
+        version (int): The current version of the parser.
+        keep (str): File name of the entry that was just used.
+    """
+    entries = []
+    for file_name in os.listdir(CACHE_DIR):
+        if not file_name.startswith(f"{name}-v") or file_name == keep:
+            continue
+        path = os.path.join(CACHE_DIR, file_name)
+        if not file_name.startswith(f"{name}-v{version}-"):
+            os.remove(path)
+        else:
+            entries.append((os.path.getmtime(path), path))
+
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_ENTRIES - 1 :]:
+        os.remove(path)
+
+
+def store(result, cache_path: str) -> None:
+    """
+    Writes a parsed input to the cache through a temporary file, so readers never
+    see a partial entry. The temporary file is removed if the write fails.
+
+    Args:
+        result: The parsed input, made of marshallable builtins.
+        cache_path (str): Path of the cache entry.
+
+    Raises:
+        OSError: If the cache directory cannot be created or written.
+        ValueError: If the result cannot be marshalled.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(marshal.dumps(result))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_or_compute(
+    name: str, version: int, content: bytes, compute: Callable[[], object]
+):
+    """
+    Loads the cached result of a computation on some content, or computes and
+    caches it. A cache that cannot be read, updated or written is skipped, since
+    it is only an optimization.
+
+    Args:
+        name (str): Unique name of the computation, e.g. "2024-day1".
+        version (int): The version of the computation.
+        content (bytes): The content the result depends on.
+        compute (Callable[[], object]): Computes the result, made of marshallable
+                                        builtins.
+
+    Returns:
+        The cached or computed result.
+    """
+    if not ENABLED:
+        return compute()
+
+    file_name = f"{name}-v{version}-{cache_key(content, version)}.marshal"
+    cache_path = os.path.join(CACHE_DIR, file_name)
+    try:
+        with open(cache_path, "rb") as file:
+            result = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    else:
+        try:
+            os.utime(cache_path)
+        except OSError:
+            # Read-only caches still serve hits, their entries just stop aging
+            pass
+        return result
+
+    result = compute()
+    try:
+        store(result, cache_path)
+        evict(name, version, file_name)
+    except OSError:
+        pass
+    return result
+
+
+def cached_parser(name: str, version: int = 1) -> Callable:
+    """
+    Caches the result of an input parser in a marshal file keyed by the hash of
+    the input content, so later runs load the parsed structure instead of parsing
+    the text again. The result must only hold marshallable builtins (lists,
+    tuples, strings, numbers...), and each call returns a fresh copy of it.
+
+    Bump the version whenever the parser changes its output, the entries of the
+    older versions are then evicted on the next call.
+
+    Args:
+        name (str): Unique name of the parser, e.g. "2024-day1".
+        version (int): The version of the parser.
+
+    Returns:
+        Callable: Decorator for a parser taking the path of the input file. The
+            uncached parser stays available as __wrapped__.
+    """
+
+    def decorator(parser: Callable) -> Callable:
+        @functools.wraps(parser)
+        def wrapper(path: str):
+            if not ENABLED:
+                return parser(path)
+            with open(path, "rb") as file:
+                content = file.read()
+            return load_or_compute(name, version, content, lambda: parser(path))
+
+        return wrapper
+
+    return decorator
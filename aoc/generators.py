@@ -0,0 +1,267 @@
+import math
+import random
+
+NOISE = "mul(don't()do()[]{}<>,;:!?%#@^&*-+'select()where()from()who() 0123456789"
+GUARD_DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def scaled(count: int, scale: float) -> int:
+    """
+    Scales a number of items, keeping at least one.
+
+    Args:
+        count (int): Number of items at scale 1.
+        scale (float): Size multiplier.
+
+    Returns:
+        int: The number of items at the given scale.
+    """
+    return max(1, round(count * scale))
+
+
+def location_pairs(scale: float, rng: random.Random) -> str:
+    """
+    Generates two columns of location IDs, 1000 pairs per unit of scale.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    return "".join(
+        f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+        for _ in range(scaled(1000, scale))
+    )
+
+
+def reports(scale: float, rng: random.Random) -> str:
+    """
+    Generates mostly monotonic reports of 5 to 8 levels with a few bad levels,
+    1000 reports per unit of scale.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        sign = rng.choice((1, -1))
+        level = rng.randint(20, 80)
+        report = []
+        for _ in range(rng.randint(5, 8)):
+            level += sign * rng.randint(1, 3)
+            report.append(level)
+        for _ in range(rng.choice((0, 0, 1, 2))):
+            report[rng.randrange(len(report))] += rng.randint(-3, 3)
+        lines.append(" ".join(map(str, report)) + "\n")
+    return "".join(lines)
+
+
+def corrupted_memory(scale: float, rng: random.Random) -> str:
+    """
+    Generates corrupted memory mixing noise with valid and broken instructions,
+    6 lines of about 3000 characters per unit of scale.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    lines = []
+    for _ in range(scaled(6, scale)):
+        parts = []
+        length = 0
+        while length < 3000:
+            choice = rng.random()
+            if choice < 0.15:
+                part = f"mul({rng.randint(0, 999)},{rng.randint(0, 999)})"
+            elif choice < 0.2:
+                part = rng.choice(("do()", "don't()", "mul(1,2", "mul(1234,5)"))
+            else:
+                part = "".join(rng.choices(NOISE, k=rng.randint(1, 8)))
+            parts.append(part)
+            length += len(part)
+        lines.append("".join(parts) + "\n")
+    return "".join(lines)
+
+
+def letter_grid(scale: float, rng: random.Random) -> str:
+    """
+    Generates a square grid of X, M, A and S letters, with 140x140 cells per unit
+    of scale, so its side grows with the square root of the scale.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    side = round(140 * math.sqrt(scale))
+    return "".join("".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side))
+
+
+def rules_and_updates(scale: float, rng: random.Random) -> str:
+    """
+    Generates rules for every pair of 49 pages in a random total order, as in the
+    puzzle input, and 200 updates of 5 to 23 pages per unit of scale. Updates do
+    not use the last page of the order, which has no rule of its own.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    order = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(order) for b in order[i + 1 :]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled(200, scale)):
+        pages = rng.sample(order[:-1], rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            pages.sort(key=order.index)
+        updates.append(",".join(map(str, pages)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def guard_path(grid: list[list[str]], start: tuple[int, int]) -> set[tuple[int, int]]:
+    """
+    Walks the guard until it leaves the map.
+
+    Args:
+        grid (list[list[str]]): The map, where the guard is known to leave.
+        start (tuple[int, int]): The starting position of the guard, facing up.
+
+    Returns:
+        set[tuple[int, int]]: The cells visited by the guard.
+    """
+    rows, cols = len(grid), len(grid[0])
+    (x, y), direction = start, 0
+    visited = {start}
+    while True:
+        dx, dy = GUARD_DIRECTIONS[direction]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < rows and 0 <= ny < cols):
+            return visited
+        if grid[nx][ny] == "#":
+            direction = (direction + 1) % 4
+        else:
+            x, y = nx, ny
+            visited.add((x, y))
+
+
+def guard_map(scale: float, rng: random.Random) -> str:
+    """
+    Generates a map where the guard spirals out from the center before leaving,
+    with 130x130 cells per unit of scale, so its side grows with the square root
+    of the scale. The spiral makes the path cover a fixed fraction of the cells
+    at every scale, which random maps do not: their guard leaves after a few
+    hundred steps whatever the size. 5% of the cells off the path are then made
+    obstacles, which keeps the path unchanged.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    side = round(130 * math.sqrt(scale))
+    gap = rng.randint(2, 4)
+    grid = [["."] * side for _ in range(side)]
+    x = y = side // 2
+    length, direction = gap, 0
+    for leg in range(1, 4 * side):
+        dx, dy = GUARD_DIRECTIONS[direction]
+        x, y = x + length * dx, y + length * dy
+        if not (0 <= x + dx < side and 0 <= y + dy < side):
+            break
+        grid[x + dx][y + dy] = "#"
+        direction = (direction + 1) % 4
+        if leg % 2 == 0:
+            length += gap
+
+    start = (side // 2, side // 2)
+    path = guard_path(grid, start)
+    for i in range(side):
+        for j in range(side):
+            if (i, j) not in path and rng.random() < 0.05:
+                grid[i][j] = "#"
+    grid[start[0]][start[1]] = "^"
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+def calibration_equations(scale: float, rng: random.Random) -> str:
+    """
+    Generates equations of operands below 100, two thirds of them built from
+    random operators so they are solvable, 850 equations per unit of scale. An
+    equation has 2 to 7 operands at scale 1, and two more for every factor of 10,
+    so the exponential cost in the number of operands shows as the scale grows.
+
+    Args:
+        scale (float): Size multiplier.
+        rng (random.Random): The seeded random generator.
+
+    Returns:
+        str: The input text.
+    """
+    max_operands = max(2, 7 + int(2 * math.log10(scale)))
+    lines = []
+    for _ in range(scaled(850, scale)):
+        nums = [rng.randint(1, 99) for _ in range(rng.randint(2, max_operands))]
+        value = nums[0]
+        for num in nums[1:]:
+            operator = rng.choice("+*|")
+            if operator == "+":
+                value += num
+            elif operator == "*":
+                value *= num
+            else:
+                value = int(f"{value}{num}")
+        if rng.random() < 1 / 3:
+            value += 1
+        lines.append(f"{value}: {' '.join(map(str, nums))}\n")
+    return "".join(lines)
+
+
+GENERATORS = {
+    2024: {
+        1: location_pairs,
+        2: reports,
+        3: corrupted_memory,
+        4: letter_grid,
+        5: rules_and_updates,
+        6: guard_map,
+        7: calibration_equations,
+    }
+}
+
+
+def generate(year: int, day: int, scale: float, seed: int = 0) -> str:
+    """
+    Generates a synthetic input of a day, reproducible for the same arguments.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        scale (float): Size multiplier, 1 being about the size of the puzzle input.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        str: The input text.
+
+    Raises:
+        KeyError: If there is no generator for the day.
+    """
+    return GENERATORS[year][day](scale, random.Random(f"{year}-{day}-{scale:g}-{seed}"))
@@ -0,0 +1,159 @@
+from collections.abc import Iterable, Sequence
+
+# Character filling the border of padded grids
+SENTINEL = "\0"
+
+# (row, column) steps, clockwise from up
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+# (row, column) steps, clockwise from up-right
+DIAGONAL = ((-1, 1), (1, 1), (1, -1), (-1, -1))
+ALL_DIRECTIONS = ORTHOGONAL + DIAGONAL
+
+
+class Grid:
+    """
+    Rectangular grid of characters stored as one buffer of bytes, row after row.
+    A cell is addressed by its index in the buffer, and a step in any direction
+    is a constant offset to add to it. An optional border of sentinel cells lets
+    walks of up to `padding` steps beyond the edges run without bounds checks.
+
+    Hot loops read `cells` directly. To try a change of a single cell, such as an
+    extra obstacle, pass its index to the walk as a parameter instead of writing
+    it into the grid (see is_loop in 2024/day6), so the grid is neither copied
+    nor modified and can be shared between processes.
+    """
+
+    __slots__ = ("rows", "cols", "padding", "width", "cells")
+
+    def __init__(
+        self,
+        lines: Iterable[str | Sequence[str]],
+        border: str | None = None,
+        padding: int = 1,
+    ):
+        rows = [
+            line.rstrip("\n") if isinstance(line, str) else "".join(line)
+            for line in lines
+        ]
+        rows = [row for row in rows if row]
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("All the rows of a grid must have the same length")
+
+        if border is None:
+            padding = 0
+            cells = bytearray("".join(rows).encode())
+        else:
+            width = cols + 2 * padding
+            cells = bytearray(border.encode() * (width * (len(rows) + 2 * padding)))
+            for i, row in enumerate(rows):
+                base = (i + padding) * width + padding
+                cells[base : base + cols] = row.encode()
+
+        self._attach(cells, len(rows), cols, padding)
+
+    @classmethod
+    def from_buffer(cls, cells, rows: int, cols: int, padding: int = 0) -> "Grid":
+        """
+        Wraps an existing buffer of cells, such as shared memory, without copying
+        it. Writes to the grid go to the buffer.
+
+        Args:
+            cells: A bytes-like buffer laid out as Grid.cells.
+            rows (int): Number of rows of the grid, border excluded.
+            cols (int): Number of columns of the grid, border excluded.
+            padding (int): Width of the border of the buffer.
+
+        Returns:
+            Grid: A grid reading its cells from the buffer.
+        """
+        grid = cls.__new__(cls)
+        grid._attach(cells, rows, cols, padding)
+        return grid
+
+    def _attach(self, cells, rows: int, cols: int, padding: int) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.padding = padding
+        self.width = cols + 2 * padding
+        self.cells = cells
+
+    def __getitem__(self, index: int) -> str:
+        return chr(self.cells[index])
+
+    def __setitem__(self, index: int, value: str) -> None:
+        self.cells[index] = ord(value)
+
+    def index(self, row: int, col: int) -> int:
+        """
+        Converts a position to the index of its cell.
+
+        Args:
+            row (int): The row, 0 being the first row inside the border.
+            col (int): The column, 0 being the first column inside the border.
+
+        Returns:
+            int: The index of the cell in the buffer.
+        """
+        return (row + self.padding) * self.width + col + self.padding
+
+    def position(self, index: int) -> tuple[int, int]:
+        """
+        Converts the index of a cell to its position.
+
+        Args:
+            index (int): The index of the cell in the buffer.
+
+        Returns:
+            tuple[int, int]: The (row, column) position, border excluded.
+        """
+        row, col = divmod(index, self.width)
+        return row - self.padding, col - self.padding
+
+    def offsets(self, directions: Iterable[tuple[int, int]]) -> tuple[int, ...]:
+        """
+        Converts (row, column) steps to index offsets.
+
+        Args:
+            directions (Iterable[tuple[int, int]]): The steps, e.g. ORTHOGONAL.
+
+        Returns:
+            tuple[int, ...]: The offset to add to an index for each step.
+        """
+        return tuple(drow * self.width + dcol for drow, dcol in directions)
+
+    def find(self, symbol: str) -> int:
+        """
+        Finds the first cell holding a symbol.
+
+        Args:
+            symbol (str): The character to find.
+
+        Returns:
+            int: The index of the cell, or -1 if the symbol is not in the grid.
+        """
+        return self._searchable().find(symbol.encode())
+
+    def find_all(self, symbol: str) -> list[int]:
+        """
+        Finds every cell holding a symbol. The buffer is scanned with bytes.find,
+        which skips to the next match in C instead of testing cells one by one
+        in Python.
+
+        Args:
+            symbol (str): The character to find.
+
+        Returns:
+            list[int]: The indices of the cells, in increasing order.
+        """
+        cells, code = self._searchable(), symbol.encode()
+        indices = []
+        index = cells.find(code)
+        while index >= 0:
+            indices.append(index)
+            index = cells.find(code, index + 1)
+        return indices
+
+    def _searchable(self) -> bytes | bytearray:
+        cells = self.cells
+        return cells if isinstance(cells, (bytes, bytearray)) else bytes(cells)
@@ -0,0 +1,248 @@
+import contextlib
+import gc
+import importlib.util
+import os
+import statistics
+import time
+import tracemalloc
+from types import ModuleType
+from typing import NamedTuple
+
+from aoc.cache import bypass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARTS = ("part_1", "part_2")
+
+
+class Measurement(NamedTuple):
+    """
+    Timings and peak memory of one stage (parsing or a part) of a day.
+    """
+
+    year: int
+    day: int
+    stage: str
+    result: object
+    times: list[float]
+    peak_memory: int | None
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the measurement to a JSON serializable dictionary.
+
+        Returns:
+            dict: The fields of the measurement, with the best and mean times.
+        """
+        record = self._asdict()
+        record["result"] = self.result if isinstance(self.result, int) else None
+        record["best"] = self.best
+        record["mean"] = self.mean
+        return record
+
+
+def parse_days(spec: str) -> list[int]:
+    """
+    Parses a selection of days such as "1-7" or "1,3,5-7".
+
+    Args:
+        spec (str): Comma-separated days or inclusive ranges of days.
+
+    Returns:
+        list[int]: The selected days, sorted and without duplicates.
+    """
+    days = set()
+    for part in spec.split(","):
+        first, _, last = part.strip().partition("-")
+        days.update(range(int(first), int(last or first) + 1))
+    return sorted(days)
+
+
+def day_directory(year: int, day: int) -> str:
+    """
+    Returns the directory holding the solution of a day.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+
+    Returns:
+        str: Path to the directory of the day.
+    """
+    return os.path.join(ROOT, str(year), f"day{day}")
+
+
+def load_day(year: int, day: int) -> ModuleType:
+    """
+    Imports the main.py module of a day.
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+
+    Returns:
+        ModuleType: The module, exposing read_input, part_1 and part_2.
+
+    Raises:
+        FileNotFoundError: If the day has no main.py.
+    """
+    path = os.path.join(day_directory(year, day), "main.py")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"No solution found for {year} day {day}: {path}")
+
+    spec = importlib.util.spec_from_file_location(f"aoc_{year}_day{day}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(
+    func, args: tuple, repeat: int, warmup: int, trace_memory: bool
+) -> tuple[object, list[float], int | None]:
+    """
+    Times a function over several runs after some warmup runs, and measures its
+    peak memory in one more run under tracemalloc, which slows it down.
+
+    Args:
+        func: The function to measure.
+        args (tuple): The arguments passed to the function.
+        repeat (int): Number of timed runs, at least 1.
+        warmup (int): Number of untimed runs before the timed ones.
+        trace_memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        tuple[object, list[float], int | None]: The result of the last run, the
+            time of every timed run and the peak memory in bytes, if measured.
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return result, times, peak_memory
+
+
+def run_day(
+    year: int,
+    day: int,
+    input_path: str | None = None,
+    repeat: int = 1,
+    warmup: int = 0,
+    trace_memory: bool = True,
+    cached: bool = False,
+) -> list[Measurement]:
+    """
+    Measures the parsing and both parts of a day. The parsed-input cache is
+    bypassed unless asked for, in which case the first run fills it and the
+    parsing stage is named "cached".
+
+    Args:
+        year (int): The year of the puzzle.
+        day (int): The day of the puzzle.
+        input_path (str | None): Input file, the input.txt of the day by default.
+        repeat (int): Number of timed runs per stage.
+        warmup (int): Number of untimed runs per stage before the timed ones.
+        trace_memory (bool): Whether to measure the peak memory of each stage.
+        cached (bool): Whether to use the parsed-input cache.
+
+    Returns:
+        list[Measurement]: The measurements of parsing, part_1 and part_2.
+    """
+    module = load_day(year, day)
+    input_path = input_path or os.path.join(day_directory(year, day), "input.txt")
+
+    with contextlib.nullcontext() if cached else bypass():
+        args, times, peak_memory = measure(
+            module.read_input, (input_path,), repeat, warmup, trace_memory
+        )
+        stage = "cached" if cached else "parse"
+        measurements = [Measurement(year, day, stage, None, times, peak_memory)]
+        for part in PARTS:
+            result, times, peak_memory = measure(
+                getattr(module, part), args, repeat, warmup, trace_memory
+            )
+            measurements.append(
+                Measurement(year, day, part, result, times, peak_memory)
+            )
+    return measurements
+
+
+def format_table(measurements: list[Measurement]) -> str:
+    """
+    Formats measurements as a human readable table.
+
+    Args:
+        measurements (list[Measurement]): The measurements to show.
+
+    Returns:
+        str: The table, one line per measurement.
+    """
+    header = f"{'year':>4} {'day':>3} {'stage':<7} {'result':>18} "
+    header += f"{'best':>10} {'mean':>10} {'peak':>10}"
+    rows = [header, "-" * len(header)]
+    for measurement in measurements:
+        result = "" if measurement.result is None else str(measurement.result)
+        peak = measurement.peak_memory
+        rows.append(
+            f"{measurement.year:>4} {measurement.day:>3} {measurement.stage:<7} "
+            f"{result:>18} {format_seconds(measurement.best):>10} "
+            f"{format_seconds(measurement.mean):>10} "
+            f"{'-' if peak is None else format_bytes(peak):>10}"
+        )
+    return "\n".join(rows)
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Formats a duration with a readable unit.
+
+    Args:
+        seconds (float): The duration in seconds.
+
+    Returns:
+        str: The duration in s, ms or µs.
+    """
+    if seconds >= 1:
+        return f"{seconds:.3f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+
+def format_bytes(size: int) -> str:
+    """
+    Formats a memory size with a readable unit.
+
+    Args:
+        size (int): The size in bytes.
+
+    Returns:
+        str: The size in B, KiB or MiB.
+    """
+    if size >= 1 << 20:
+        return f"{size / (1 << 20):.1f}MiB"
+    if size >= 1 << 10:
+        return f"{size / (1 << 10):.1f}KiB"
+    return f"{size}B"